@@ -2,13 +2,18 @@
 # This is the main file for Hugging Face Spaces deployment
 
 import streamlit as st
+import runpy
 import sys
 import os
 
 # Add the current directory to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bootstrap  # noqa: F401  (loads .env)
 
 # Import and run the main Streamlit app
 if __name__ == "__main__":
-    # This will be executed when the app starts on Hugging Face Spaces
-    exec(open('streamlit_app.py').read())
\ No newline at end of file
+    # This will be executed when the app starts on Hugging Face Spaces.
+    # run_module goes through the import system, so the compiled bytecode in
+    # __pycache__ is reused and the app's globals stay out of this module.
+    runpy.run_module("streamlit_app", run_name="__main__")
\ No newline at end of file
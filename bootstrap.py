@@ -0,0 +1,11 @@
+# Process-wide startup shared by the app entry points.
+# Importing this module loads .env once per process; variables that are
+# already set in the environment take precedence over the file.
+
+try:
+    from dotenv import load_dotenv
+    DOTENV_AVAILABLE = True
+except ImportError:
+    DOTENV_AVAILABLE = False
+else:
+    load_dotenv(override=False)
@@ -1,46 +1,248 @@
+import bootstrap  # noqa: F401  (loads .env)
 import gradio as gr
-import pandas as pd
+import asyncio
 import datetime
-import json
+import functools
 import os
-from dotenv import load_dotenv
+import threading
+from typing import Final
 
-# Load environment variables
-load_dotenv()
+import results_cache
 
-# Import TradingAgents
-try:
+# TradingAgents pulls in LangChain, LangGraph, yfinance and pandas, so it is
+# imported on the first analysis instead of before the UI can render.
+@functools.lru_cache(maxsize=1)
+def _get_trading_agents():
+    """Import and return TradingAgentsGraph and DEFAULT_CONFIG"""
     from tradingagents.graph.trading_graph import TradingAgentsGraph
     from tradingagents.default_config import DEFAULT_CONFIG
-    TRADING_AGENTS_AVAILABLE = True
-except ImportError:
-    TRADING_AGENTS_AVAILABLE = False
+    return TradingAgentsGraph, DEFAULT_CONFIG
 
-def run_trading_analysis(ticker, date_str, selected_analysts):
-    """Run trading analysis and return formatted results"""
+# LLM used for both the deep and quick thinking agents
+ANALYSIS_MODEL = "gpt-4o-mini"
+
+# Tickers accepted per request, and how many of them are analyzed at once
+MAX_TICKERS = 10
+MAX_CONCURRENT_TICKERS = 3
+
+# Compiled graphs keyed by analyst set and the settings that shape the graph
+_GRAPH_CACHE = {}
+_GRAPH_CACHE_LOCK = threading.Lock()
+
+def _get_graph(selected_analysts):
+    """Return a TradingAgentsGraph for the selected analysts, building it only once"""
+    TradingAgentsGraph, DEFAULT_CONFIG = _get_trading_agents()
+    
+    # Create config
+    config = DEFAULT_CONFIG.copy()
+    config["deep_think_llm"] = ANALYSIS_MODEL
+    config["quick_think_llm"] = ANALYSIS_MODEL
+    config["max_debate_rounds"] = 1
+    config["prompt_cache_key"] = "trading-agents-v1"
+    config["llm_http2"] = True
+    config["llm_streaming"] = True
     
-    if not TRADING_AGENTS_AVAILABLE:
-        return "❌ TradingAgents framework not available", "", ""
+    key = (
+        frozenset(selected_analysts),
+        config["deep_think_llm"],
+        config["quick_think_llm"],
+        config["max_debate_rounds"],
+    )
+    with _GRAPH_CACHE_LOCK:
+        ta = _GRAPH_CACHE.get(key)
+        if ta is None:
+            ta = TradingAgentsGraph(
+                selected_analysts=selected_analysts,
+                debug=False,
+                config=config
+            )
+            _GRAPH_CACHE[key] = ta
+    
+    return ta
+
+# (state key, emoji, title) for each section of the reports and trading tabs
+REPORT_SPEC = (
+    ("market_report", "📊", "Market Analysis"),
+    ("sentiment_report", "💭", "Sentiment Analysis"),
+    ("news_report", "📰", "News Analysis"),
+    ("fundamentals_report", "📈", "Fundamentals Analysis"),
+)
+TRADE_SPEC = (
+    ("investment_plan", "🔬", "Research Team Decision"),
+    ("trader_investment_plan", "💼", "Trading Plan"),
+    ("final_trade_decision", "📋", "Final Trade Decision"),
+)
+
+def format_reports(state):
+    """Format the analyst reports that are populated in the given state"""
+    return "\n".join(
+        f"## {emoji} {title}\n{state[key]}\n"
+        for key, emoji, title in REPORT_SPEC if state.get(key)
+    )
+
+def format_trading(state):
+    """Format the research, trader and risk decisions populated in the given state"""
+    return "\n\n".join(
+        f"## {emoji} {title}\n{state[key]}"
+        for key, emoji, title in TRADE_SPEC if state.get(key)
+    )
+
+# Characters of live output kept per agent in the summary tab while running
+ACTIVITY_TAIL_CHARS = 800
+
+def apply_agent_event(activity, event):
+    """Add a thought/action/result event to the per-agent activity buffers"""
+    agent = event["agent"] or "Agent"
+    entry = activity.setdefault(agent, {"text": "", "streamed": False})
+    if event["event_type"] == "thought":
+        entry["text"] += event["content"]
+        entry["streamed"] = True
+    elif event["event_type"] == "action":
+        entry["text"] += f"\n\n🔧 `{event['content']}`\n\n"
+    elif event["event_type"] == "result":
+        # Tokens were already shown unless the LLM did not stream
+        if not entry["streamed"]:
+            entry["text"] += event["content"]
+        entry["text"] += "\n\n"
+        entry["streamed"] = False
+
+def format_activity(activity):
+    """Format the latest output of every agent that has been active"""
+    return "\n".join(
+        f"### {agent}\n{entry['text'][-ACTIVITY_TAIL_CHARS:]}\n"
+        for agent, entry in activity.items()
+    )
+
+def combine_ticker_outputs(outputs):
+    """Merge per-ticker (summary, reports, trading) outputs into ## {ticker} sections"""
+    return tuple(
+        "\n\n".join(f"## {ticker}\n{output[i]}" for ticker, output in outputs.items())
+        for i in range(3)
+    )
+
+async def run_trading_analysis(ticker, date_str, selected_analysts, force_refresh=False):
+    """Run trading analysis and stream agent output and reports as they are produced
+
+    ticker may be a comma-separated list of up to MAX_TICKERS tickers; they are
+    analyzed on the same graph, MAX_CONCURRENT_TICKERS at a time, and shown as
+    one section per ticker.
+    """
     
-    if not ticker:
-        return "❌ Please enter a stock ticker", "", ""
+    tickers = [t.strip().upper() for t in (ticker or "").split(",") if t.strip()]
+    if not tickers:
+        yield "❌ Please enter a stock ticker", "", ""
+        return
+    if len(tickers) > MAX_TICKERS:
+        yield f"❌ Please enter at most {MAX_TICKERS} tickers", "", ""
+        return
     
+    # Default a blank date to today, reject malformed ones up front and
+    # canonicalize for the cache key
+    date_str = (date_str or "").strip() or datetime.date.today().isoformat()
     try:
-        # Create config
-        config = DEFAULT_CONFIG.copy()
-        config["deep_think_llm"] = "gpt-4o-mini"
-        config["quick_think_llm"] = "gpt-4o-mini"
-        config["max_debate_rounds"] = 1
-        
-        # Initialize TradingAgents
-        ta = TradingAgentsGraph(
-            selected_analysts=selected_analysts,
-            debug=False,
-            config=config
-        )
+        date_str = datetime.datetime.strptime(date_str, "%Y-%m-%d").date().isoformat()
+    except ValueError:
+        yield "❌ Date must be YYYY-MM-DD", "", ""
+        return
+    
+    if len(tickers) == 1:
+        async for outputs in analyze_ticker(tickers[0], date_str, selected_analysts, force_refresh):
+            yield outputs
+        return
+    
+    # Each ticker streams into its own slot; None marks a finished ticker
+    latest = {t: ("", "", "") for t in tickers}
+    updates = asyncio.Queue()
+    slots = asyncio.Semaphore(MAX_CONCURRENT_TICKERS)
+    
+    async def run_one(t):
+        try:
+            async with slots:
+                async for outputs in analyze_ticker(t, date_str, selected_analysts, force_refresh):
+                    latest[t] = outputs
+                    updates.put_nowait(t)
+        finally:
+            updates.put_nowait(None)
+    
+    pipelines = asyncio.gather(*(run_one(t) for t in tickers))
+    remaining = len(tickers)
+    try:
+        while remaining:
+            events = [await updates.get()]
+            while not updates.empty():
+                events.append(updates.get_nowait())
+            remaining -= events.count(None)
+            yield combine_ticker_outputs(latest)
+        await pipelines
+    finally:
+        pipelines.cancel()
+
+async def analyze_ticker(ticker, date_str, selected_analysts, force_refresh=False):
+    """Analyze a single ticker and stream agent output and reports as they are produced
+
+    The selected analysts run concurrently; deselected analysts are never scheduled.
+    LLM tokens and tool calls are shown in the summary tab as they arrive.
+    Finished analyses are cached on disk and returned directly for repeat requests
+    unless force_refresh is set.
+    """
+    
+    cache_key = results_cache.make_key(ticker, date_str, selected_analysts, ANALYSIS_MODEL)
+    if not force_refresh:
+        cached = await asyncio.to_thread(results_cache.get_result, cache_key)
+        if cached is not None:
+            yield tuple(cached)
+            return
+    
+    try:
+        # Initialize TradingAgents (imported and compiled on first use)
+        ta = await asyncio.to_thread(_get_graph, list(selected_analysts))
+        
+        from tradingagents.graph.streaming import AgentEventHandler
+        
+        # Stream partial results while the agents are running
+        running = f"## ⏳ Analyzing {ticker}...\nAgent output appears below as it is generated."
+        yield running, "", ""
+        
+        # Agent events and graph states share one queue; None marks the end
+        queue = asyncio.Queue()
+        handler = AgentEventHandler(queue)
         
-        # Run analysis
-        final_state, decision = ta.propagate(ticker, date_str)
+        async def run_pipeline():
+            try:
+                async for state in ta.astream_propagate(ticker, date_str, callbacks=[handler]):
+                    queue.put_nowait({"event_type": "state", "agent": "", "content": state})
+            finally:
+                queue.put_nowait(None)
+        
+        pipeline = asyncio.create_task(run_pipeline())
+        final_state = {}
+        activity = {}
+        try:
+            done = False
+            while not done:
+                # Render once per batch of queued events rather than per token
+                events = [await queue.get()]
+                while not queue.empty():
+                    events.append(queue.get_nowait())
+                for event in events:
+                    if event is None:
+                        done = True
+                    elif event["event_type"] == "state":
+                        final_state = event["content"]
+                    else:
+                        apply_agent_event(activity, event)
+                yield (
+                    f"{running}\n\n{format_activity(activity)}",
+                    format_reports(final_state),
+                    format_trading(final_state),
+                )
+            await pipeline
+        finally:
+            pipeline.cancel()
+        
+        decision = await asyncio.to_thread(
+            ta.process_signal, final_state["final_trade_decision"]
+        )
         
         # Format results
         summary = f"""
@@ -50,65 +252,115 @@ def run_trading_analysis(ticker, date_str, selected_analysts):
 **Analysis Time:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         """
         
-        # Extract reports
-        reports = []
-        if 'market_report' in final_state and final_state['market_report']:
-            reports.append(f"## 📊 Market Analysis\n{final_state['market_report']}\n")
-        if 'sentiment_report' in final_state and final_state['sentiment_report']:
-            reports.append(f"## 💭 Sentiment Analysis\n{final_state['sentiment_report']}\n")
-        if 'news_report' in final_state and final_state['news_report']:
-            reports.append(f"## 📰 News Analysis\n{final_state['news_report']}\n")
-        if 'fundamentals_report' in final_state and final_state['fundamentals_report']:
-            reports.append(f"## 📈 Fundamentals Analysis\n{final_state['fundamentals_report']}\n")
-        
-        detailed_reports = "\n".join(reports)
-        
-        # Trading decision
-        trading_info = ""
-        if 'investment_plan' in final_state and final_state['investment_plan']:
-            trading_info += f"## 🔬 Research Team Decision\n{final_state['investment_plan']}\n\n"
-        if 'trader_investment_plan' in final_state and final_state['trader_investment_plan']:
-            trading_info += f"## 💼 Trading Plan\n{final_state['trader_investment_plan']}\n\n"
-        if 'final_trade_decision' in final_state and final_state['final_trade_decision']:
-            trading_info += f"## 📋 Final Trade Decision\n{final_state['final_trade_decision']}\n"
-        
-        return summary, detailed_reports, trading_info
+        analyst_errors = final_state.get("analyst_errors") or {}
+        if analyst_errors:
+            summary += "\n⚠️ **Failed analysts:** " + ", ".join(
+                f"{name} ({error})" for name, error in analyst_errors.items()
+            )
         
+        result = (summary, format_reports(final_state), format_trading(final_state))
+        
+        # Degraded runs are shown but not cached, so the next request retries them
+        complete = not analyst_errors and all(
+            final_state.get(spec.report_key) for spec in ta.analyst_specs
+        )
+        if complete:
+            await asyncio.to_thread(results_cache.set_result, cache_key, *result)
+        yield result
+        
+    except ImportError:
+        yield "❌ TradingAgents framework not available", "", ""
     except Exception as e:
         error_msg = f"❌ Analysis failed: {str(e)}"
-        return error_msg, "", ""
+        yield error_msg, "", ""
+
+async def run_trading_analysis_batch(tickers, dates, analysts_lists):
+    """Batched, non-streaming variant of run_trading_analysis for API clients
+
+    Gradio collects queued requests into lists; the analyses in a batch run
+    concurrently and the three outputs are returned as lists of equal length.
+    """
+    async def run_one(ticker, date_str, selected_analysts):
+        result = ("", "", "")
+        async for result in run_trading_analysis(ticker, date_str, selected_analysts):
+            pass
+        return result
+    
+    results = await asyncio.gather(
+        *(run_one(*request) for request in zip(tickers, dates, analysts_lists))
+    )
+    summaries, reports, trading = (list(column) for column in zip(*results))
+    return summaries, reports, trading
+
+def clear_cache():
+    """Clear cached market data so the next analysis refetches it"""
+    try:
+        from tradingagents.dataflows.cache import clear_data_cache
+    except ImportError:
+        return "❌ TradingAgents framework not available"
+    
+    clear_data_cache()
+    return "🧹 Data cache cleared"
+
+# Static UI content, built once at import
+CSS: Final[str] = """
+.gradio-container {
+    max-width: 1200px !important;
+}
+.gr-button-primary {
+    background: linear-gradient(90deg, #1f4e79 0%, #2e7d9a 100%);
+}
+"""
+
+HEADER_MD: Final[str] = """
+# 🤖 TradingAgents - Multi-Agent Trading Framework
+
+**Comprehensive stock analysis powered by AI agents**
+
+This system uses multiple specialized AI agents to analyze stocks from different perspectives:
+- 📊 **Market Analyst**: Technical indicators and price analysis
+- 💭 **Social Analyst**: Sentiment from social media and forums  
+- 📰 **News Analyst**: Latest news impact assessment
+- 📈 **Fundamentals Analyst**: Financial health and metrics
+- 🔬 **Research Team**: Bull vs Bear debate analysis
+- 💼 **Trader**: Final investment recommendations
+- ⚠️ **Risk Management**: Multi-perspective risk assessment
+"""
+
+ABOUT_MD: Final[str] = """
+### ℹ️ About the Analysis
+- **Duration**: 2-5 minutes depending on complexity
+- **Models**: GPT-4o-mini for cost efficiency
+- **Data Sources**: yfinance, Alpha Vantage (cached for 24h)
+- **Security**: API keys embedded securely
+"""
+
+FOOTER_MD: Final[str] = """
+---
+**⚠️ Disclaimer**: This is for research and educational purposes only. Not financial advice.
+
+**🔗 Links**: [GitHub Repository](https://github.com/Arvindraj799/trading-agent) | [Original Framework](https://github.com/TauricResearch/TradingAgents)
+"""
 
+SUMMARY_PLACEHOLDER: Final[str] = "Click 'Run Analysis' to see the final trading decision and summary"
+REPORTS_PLACEHOLDER: Final[str] = "Detailed analysis from each AI agent will appear here"
+TRADING_PLACEHOLDER: Final[str] = "Trading recommendations and risk assessment will appear here"
+
+@functools.lru_cache(maxsize=1)
 def create_gradio_interface():
-    """Create and return Gradio interface"""
+    """Create and return Gradio interface
+
+    The Blocks tree is built once and reused if the launcher is re-entered.
+    """
     
     with gr.Blocks(
         title="🤖 TradingAgents - Multi-Agent Trading Analysis",
         theme=gr.themes.Soft(),
-        css="""
-        .gradio-container {
-            max-width: 1200px !important;
-        }
-        .gr-button-primary {
-            background: linear-gradient(90deg, #1f4e79 0%, #2e7d9a 100%);
-        }
-        """
+        css=CSS
     ) as app:
         
         # Header
-        gr.Markdown("""
-        # 🤖 TradingAgents - Multi-Agent Trading Framework
-        
-        **Comprehensive stock analysis powered by AI agents**
-        
-        This system uses multiple specialized AI agents to analyze stocks from different perspectives:
-        - 📊 **Market Analyst**: Technical indicators and price analysis
-        - 💭 **Social Analyst**: Sentiment from social media and forums  
-        - 📰 **News Analyst**: Latest news impact assessment
-        - 📈 **Fundamentals Analyst**: Financial health and metrics
-        - 🔬 **Research Team**: Bull vs Bear debate analysis
-        - 💼 **Trader**: Final investment recommendations
-        - ⚠️ **Risk Management**: Multi-perspective risk assessment
-        """)
+        gr.Markdown(HEADER_MD)
         
         with gr.Row():
             with gr.Column(scale=1):
@@ -119,7 +371,7 @@ def create_gradio_interface():
                     label="Stock Ticker",
                     placeholder="Enter stock symbol (e.g., NVDA, AAPL, TSLA)",
                     value="NVDA",
-                    info="Stock symbol to analyze"
+                    info="One ticker or comma-separated list"
                 )
                 
                 date_input = gr.Textbox(
@@ -136,20 +388,26 @@ def create_gradio_interface():
                     info="Choose which AI agents to include in analysis"
                 )
                 
+                force_refresh_input = gr.Checkbox(
+                    label="Force refresh",
+                    value=False,
+                    info="Rerun the analysis even if a cached result exists"
+                )
+                
                 analyze_btn = gr.Button(
                     "🔍 Run Multi-Agent Analysis",
                     variant="primary",
                     size="lg"
                 )
                 
+                # API-only endpoint that batches concurrent requests
+                batch_btn = gr.Button(visible=False)
+                
+                clear_cache_btn = gr.Button("🧹 Clear Data Cache", size="sm")
+                cache_status = gr.Markdown()
+                
                 # Status and info
-                gr.Markdown("""
-                ### ℹ️ About the Analysis
-                - **Duration**: 2-5 minutes depending on complexity
-                - **Models**: GPT-4o-mini for cost efficiency
-                - **Data Sources**: yfinance, Alpha Vantage
-                - **Security**: API keys embedded securely
-                """)
+                gr.Markdown(ABOUT_MD)
             
             with gr.Column(scale=2):
                 # Results section
@@ -158,37 +416,49 @@ def create_gradio_interface():
                 with gr.Tabs():
                     with gr.TabItem("🎯 Summary & Decision"):
                         summary_output = gr.Markdown(
-                            "Click 'Run Analysis' to see the final trading decision and summary",
+                            SUMMARY_PLACEHOLDER,
                             label="Analysis Summary"
                         )
                     
                     with gr.TabItem("📋 Detailed Reports"):
                         reports_output = gr.Markdown(
-                            "Detailed analysis from each AI agent will appear here",
+                            REPORTS_PLACEHOLDER,
                             label="Agent Reports"
                         )
                     
                     with gr.TabItem("💼 Trading & Risk"):
                         trading_output = gr.Markdown(
-                            "Trading recommendations and risk assessment will appear here",
+                            TRADING_PLACEHOLDER,
                             label="Trading Analysis"
                         )
         
         # Connect the button to the function
         analyze_btn.click(
             fn=run_trading_analysis,
+            inputs=[ticker_input, date_input, analysts_input, force_refresh_input],
+            outputs=[summary_output, reports_output, trading_output],
+            show_progress="minimal",
+            api_name="analyze",
+            concurrency_limit=4
+        )
+        
+        batch_btn.click(
+            fn=run_trading_analysis_batch,
             inputs=[ticker_input, date_input, analysts_input],
             outputs=[summary_output, reports_output, trading_output],
-            show_progress=True
+            api_name="analyze_batch",
+            batch=True,
+            max_batch_size=8,
+            concurrency_limit=4
         )
         
-        # Footer
-        gr.Markdown("""
-        ---
-        **⚠️ Disclaimer**: This is for research and educational purposes only. Not financial advice.
+        clear_cache_btn.click(
+            fn=clear_cache,
+            outputs=[cache_status]
+        )
         
-        **🔗 Links**: [GitHub Repository](https://github.com/Arvindraj799/trading-agent) | [Original Framework](https://github.com/TauricResearch/TradingAgents)
-        """)
+        # Footer
+        gr.Markdown(FOOTER_MD)
     
     return app
 
@@ -201,9 +471,11 @@ if __name__ == "__main__":
     
     # Launch the app
     app = create_gradio_interface()
+    app.queue(max_size=64, default_concurrency_limit=4)
     app.launch(
         server_name="0.0.0.0",
-        server_port=7860,
-        share=True,  # Creates public URL
-        show_error=True
+        server_port=int(os.getenv("PORT", 7860)),
+        share=os.getenv("GRADIO_SHARE") == "1",  # Public gradio.live tunnel, opt-in
+        show_error=True,
+        max_threads=40
     )
\ No newline at end of file
@@ -0,0 +1,54 @@
+import hashlib
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+from tradingagents.dataflows import fastjson
+
+# SQLite database holding finished analyses, next to the app by default
+DB_PATH = os.getenv(
+    "RESULTS_CACHE_DB",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "results_cache.db"),
+)
+
+# Seconds a stored analysis is served before it is run again
+TTL = int(os.getenv("RESULTS_CACHE_TTL", 24 * 60 * 60))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    summary TEXT,
+    reports TEXT,
+    trading TEXT,
+    ts INTEGER
+)
+"""
+
+def make_key(ticker, date_str, selected_analysts, model):
+    """Return the cache key for an analysis request"""
+    payload = fastjson.dumps([ticker, date_str, sorted(selected_analysts), model])
+    return hashlib.sha256(payload).hexdigest()
+
+def _connect(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute(_SCHEMA)
+    return conn
+
+def get_result(key, db_path=DB_PATH, ttl=TTL):
+    """Return the cached (summary, reports, trading) for key, or None if missing or expired"""
+    with closing(_connect(db_path)) as conn, conn:
+        row = conn.execute(
+            "SELECT summary, reports, trading FROM results WHERE key = ? AND ts >= ?",
+            (key, int(time.time()) - ttl),
+        ).fetchone()
+    return row
+
+def set_result(key, summary, reports, trading, db_path=DB_PATH):
+    """Store the formatted outputs of a finished analysis"""
+    with closing(_connect(db_path)) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO results (key, summary, reports, trading, ts) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, summary, reports, trading, int(time.time())),
+        )
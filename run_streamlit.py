@@ -8,28 +8,32 @@ with proper environment setup and error handling.
 
 import os
 import sys
-import subprocess
+import bootstrap  # noqa: F401  (loads .env)
+import functools
+import importlib.util
 from pathlib import Path
-from dotenv import load_dotenv
+
+# (pip package, import name) pairs the launcher needs
+REQUIRED_PACKAGES = (
+    ('streamlit', 'streamlit'),
+    ('plotly', 'plotly'),
+    ('pandas', 'pandas'),
+    ('yfinance', 'yfinance'),
+    ('python-dotenv', 'dotenv'),
+)
+
+@functools.lru_cache(maxsize=None)
+def _is_installed(module_name: str) -> bool:
+    """Check whether a module can be imported without executing it"""
+    return importlib.util.find_spec(module_name) is not None
 
 def check_requirements():
     """Check if required packages are installed"""
-    required_packages = [
-        'streamlit',
-        'plotly', 
-        'pandas',
-        'yfinance',
-        'python-dotenv'
+    missing_packages = [
+        package for package, module_name in REQUIRED_PACKAGES
+        if not _is_installed(module_name)
     ]
     
-    missing_packages = []
-    
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
-            missing_packages.append(package)
-    
     if missing_packages:
         print(f"❌ Missing required packages: {', '.join(missing_packages)}")
         print("Please install them using:")
@@ -40,13 +44,11 @@ def check_requirements():
 
 def check_env_setup():
     """Check if environment variables are properly set"""
-    load_dotenv()
-    
     required_env_vars = ['OPENAI_API_KEY', 'ALPHA_VANTAGE_API_KEY']
     missing_vars = []
     
     for var in required_env_vars:
-        if not os.getenv(var):
+        if not os.environ.get(var):
             missing_vars.append(var)
     
     if missing_vars:
@@ -94,21 +96,17 @@ def main():
     print("\n" + "=" * 50)
     
     try:
-        # Run streamlit
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", 
-            str(streamlit_app_path),
-            "--server.address", "localhost",
-            "--server.port", "8501"
-        ], check=True)
+        # Run streamlit in this interpreter instead of starting a second one
+        from streamlit.web import bootstrap as st_bootstrap
+        
+        flag_options = {
+            "server_address": "localhost",
+            "server_port": 8501,
+        }
+        st_bootstrap.load_config_options(flag_options=flag_options)
+        st_bootstrap.run(str(streamlit_app_path), False, [], flag_options)
     except KeyboardInterrupt:
         print("\n👋 Application stopped by user")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error running Streamlit: {e}")
-        sys.exit(1)
-    except FileNotFoundError:
-        print("❌ Streamlit not found. Please install it using: pip install streamlit")
-        sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,31 +1,42 @@
 import streamlit as st
 import pandas as pd
+import asyncio
 import datetime
+import functools
+import importlib.util
 import json
+import logging
 import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 import traceback
 
+# Loads .env once per process rather than on every rerun
+import bootstrap
+
+logger = logging.getLogger(__name__)
+
 # Handle optional imports gracefully
-try:
-    from dotenv import load_dotenv
-except ImportError:
+if not bootstrap.DOTENV_AVAILABLE:
     st.warning("python-dotenv not available. Environment variables must be set manually.")
-    def load_dotenv():
-        pass
 
-try:
-    import plotly.graph_objects as go
-    import plotly.express as px
-    from plotly.subplots import make_subplots
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
-    go = None
-    px = None
-
-# Load environment variables
-load_dotenv()
+# Plotly is only imported once a chart is drawn, so these probe without importing it
+@functools.lru_cache(maxsize=1)
+def plotly_available() -> bool:
+    """Check whether plotly is installed"""
+    return importlib.util.find_spec("plotly") is not None
+
+@functools.lru_cache(maxsize=1)
+def register_resampler() -> bool:
+    """Downsample long chart traces (LTTB) before they are sent to the browser"""
+    try:
+        from plotly_resampler import register_plotly_resampler
+    except ImportError:
+        return False
+    register_plotly_resampler(mode='auto', default_n_shown_samples=2000)
+    return True
 
 # Import TradingAgents components - simplified for Streamlit Cloud
 TRADINGAGENTS_AVAILABLE = False
@@ -34,6 +45,7 @@ DEFAULT_CONFIG = {
     "deep_think_llm": "gpt-4o-mini",
     "quick_think_llm": "gpt-4o-mini",
     "project_dir": "./",
+    "llm_streaming": True,
 }
 
 class TradingAgentsGraph:
@@ -41,13 +53,23 @@ class TradingAgentsGraph:
     def __init__(self, *args, **kwargs):
         raise NotImplementedError("TradingAgentsGraph requires full package installation. Use gradio_app.py instead.")
 
+@st.cache_resource(show_spinner=False)
+def get_trading_graph(selected_analysts: tuple, config_key: str) -> TradingAgentsGraph:
+    """Build a TradingAgentsGraph once per analyst set and config, shared across reruns and sessions"""
+    return TradingAgentsGraph(
+        selected_analysts=list(selected_analysts),
+        debug=False,
+        config=json.loads(config_key)
+    )
+
 # Import utility functions with fallback
 try:
     from streamlit_utils import (
-        create_stock_chart, create_volume_chart, get_stock_info,
+        create_stock_chart, create_volume_chart, get_stock_info, load_ticker_bundle,
         create_metrics_dashboard, create_risk_gauge, create_sentiment_pie_chart,
-        export_analysis_to_json, display_config_summary, validate_configuration,
-        format_currency, format_percentage
+        export_analysis_to_json, display_config_summary, format_config_summary,
+        validate_configuration, clear_market_data_cache, should_refresh,
+        format_currency, format_percentage, _status_key
     )
     UTILS_AVAILABLE = True
 except ImportError as e:
@@ -56,15 +78,20 @@ except ImportError as e:
     # Create dummy functions
     def create_stock_chart(*args, **kwargs): return None
     def create_volume_chart(*args, **kwargs): return None
-    def get_stock_info(*args, **kwargs): return {}
+    def get_stock_info(*args, **kwargs): return None
+    def load_ticker_bundle(*args, **kwargs): return pd.DataFrame(), {}
     def create_metrics_dashboard(*args, **kwargs): pass
     def create_risk_gauge(*args, **kwargs): return None
     def create_sentiment_pie_chart(*args, **kwargs): return None
     def export_analysis_to_json(*args, **kwargs): return ""
     def display_config_summary(*args, **kwargs): pass
+    def format_config_summary(*args, **kwargs): return ("", "")
     def validate_configuration(*args, **kwargs): return []
+    def clear_market_data_cache(): pass
+    def should_refresh(*args, **kwargs): return True
     def format_currency(value): return f"${value:.2f}"
     def format_percentage(value): return f"{value:.2f}%"
+    def _status_key(agent_name): return f"{agent_name.lower().replace(' ', '_')}_status"
 
 # Page configuration
 st.set_page_config(
@@ -74,34 +101,18 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
-<style>
-    .main-header {
-        text-align: center;
-        padding: 2rem 0;
-        background: linear-gradient(90deg, #1f4e79 0%, #2e7d9a 100%);
-        color: white;
-        border-radius: 10px;
-        margin-bottom: 2rem;
-    }
-    .report-section {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 5px;
-        margin: 1rem 0;
-        border-left: 4px solid #007bff;
-    }
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 2px;
-    }
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
-        padding-left: 20px;
-        padding-right: 20px;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS for better styling, read from disk once per process
+@st.cache_resource(show_spinner=False)
+def _load_css() -> str:
+    css_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".streamlit", "style.css")
+    try:
+        with open(css_path, encoding="utf-8") as f:
+            return f"<style>{f.read()}</style>"
+    except OSError:
+        logger.warning("Stylesheet not found at %s", css_path)
+        return ""
+
+st.markdown(_load_css(), unsafe_allow_html=True)
 
 # Main application
 st.title("🚀 TradingAgents Framework")
@@ -130,6 +141,12 @@ def initialize_session_state():
         st.session_state.analysis_running = False
     if 'config' not in st.session_state:
         st.session_state.config = DEFAULT_CONFIG.copy()
+    if 'executor' not in st.session_state:
+        st.session_state.executor = ThreadPoolExecutor(max_workers=2)
+    if 'analysis_job' not in st.session_state:
+        st.session_state.analysis_job = None
+    if 'ticker_bundle' not in st.session_state:
+        st.session_state.ticker_bundle = (pd.DataFrame(), {})
 
 def create_sidebar():
     """Create the configuration sidebar"""
@@ -223,6 +240,15 @@ def create_sidebar():
         index=0
     )
     
+    st.sidebar.checkbox(
+        "Debug mode",
+        key="debug_mode",
+        help="Show full tracebacks when an analysis fails"
+    )
+    
+    if st.sidebar.button("🔄 Refresh Market Data", help="Refetch prices and company info from Yahoo Finance"):
+        clear_market_data_cache()
+    
     # Update session state config
     st.session_state.config.update({
         "llm_provider": llm_provider,
@@ -240,127 +266,419 @@ def create_sidebar():
     
     return selected_analysts
 
+# Status card styling for display_agent_status
+_STATUS_CONFIG = {
+    'pending': {'emoji': '⏳', 'color': '#6c757d', 'bg': '#f8f9fa'},
+    'running': {'emoji': '🔄', 'color': '#856404', 'bg': '#fff3cd'},
+    'completed': {'emoji': '✅', 'color': '#155724', 'bg': '#d4edda'},
+    'error': {'emoji': '❌', 'color': '#721c24', 'bg': '#f8d7da'}
+}
+
+# Agent groups with emojis and colors
+_AGENT_GROUPS = {
+    "📊 Analysts": {
+        "agents": ["Market Analyst", "Social Analyst", "News Analyst", "Fundamentals Analyst"],
+        "color": "#e3f2fd"
+    },
+    "🔬 Researchers": {
+        "agents": ["Bull Researcher", "Bear Researcher", "Research Manager"],
+        "color": "#f3e5f5"
+    },
+    "💼 Trading": {
+        "agents": ["Trader"],
+        "color": "#e8f5e8"
+    },
+    "⚠️ Risk Mgmt": {
+        "agents": ["Risky Analyst", "Neutral Analyst", "Safe Analyst"],
+        "color": "#fff3e0"
+    },
+    "👔 Portfolio": {
+        "agents": ["Portfolio Manager"],
+        "color": "#fce4ec"
+    }
+}
+
+# (agent, session state status key) pairs per group
+_AGENT_KEYS = {
+    group: [(agent, _status_key(agent)) for agent in data['agents']]
+    for group, data in _AGENT_GROUPS.items()
+}
+
 def display_agent_status():
     """Display the status of all agents in a clean, organized layout"""
     st.subheader("🎯 Agent Status")
     
-    # Define agent groups with emojis and colors
-    agent_groups = {
-        "📊 Analysts": {
-            "agents": ["Market Analyst", "Social Analyst", "News Analyst", "Fundamentals Analyst"],
-            "color": "#e3f2fd"
-        },
-        "🔬 Researchers": {
-            "agents": ["Bull Researcher", "Bear Researcher", "Research Manager"],
-            "color": "#f3e5f5"
-        },
-        "💼 Trading": {
-            "agents": ["Trader"],
-            "color": "#e8f5e8"
-        },
-        "⚠️ Risk Mgmt": {
-            "agents": ["Risky Analyst", "Neutral Analyst", "Safe Analyst"],
-            "color": "#fff3e0"
-        },
-        "👔 Portfolio": {
-            "agents": ["Portfolio Manager"],
-            "color": "#fce4ec"
-        }
-    }
-    
-    # Create a more compact layout
-    for group_name, group_data in agent_groups.items():
-        with st.expander(f"{group_name} ({len(group_data['agents'])} agents)", expanded=False):
-            cols = st.columns(min(len(group_data['agents']), 3))  # Max 3 columns
+    # Create a more compact layout, one markdown element per group
+    for group_name, agent_keys in _AGENT_KEYS.items():
+        with st.expander(f"{group_name} ({len(agent_keys)} agents)", expanded=False):
+            html_parts = ['<div style="display: flex; gap: 0.5rem; flex-wrap: wrap;">']
             
-            for idx, agent in enumerate(group_data['agents']):
-                col_idx = idx % 3
-                with cols[col_idx]:
-                    status = st.session_state.get(f'{agent.lower().replace(" ", "_")}_status', 'pending')
-                    
-                    # Status styling
-                    status_config = {
-                        'pending': {'emoji': '⏳', 'color': '#6c757d', 'bg': '#f8f9fa'},
-                        'running': {'emoji': '🔄', 'color': '#856404', 'bg': '#fff3cd'},
-                        'completed': {'emoji': '✅', 'color': '#155724', 'bg': '#d4edda'},
-                        'error': {'emoji': '❌', 'color': '#721c24', 'bg': '#f8d7da'}
-                    }
-                    
-                    config = status_config.get(status, status_config['pending'])
-                    
-                    st.markdown(
-                        f'<div style="'
-                        f'background-color: {config["bg"]}; '
-                        f'color: {config["color"]}; '
-                        f'padding: 0.5rem; '
-                        f'border-radius: 5px; '
-                        f'margin: 0.2rem 0; '
-                        f'text-align: center; '
-                        f'font-size: 0.9rem; '
-                        f'border: 1px solid {config["color"]}20;'
-                        f'">'
-                        f'{config["emoji"]} {agent.replace(" ", "<br>")}<br>'
-                        f'<small><i>{status.title()}</i></small>'
-                        f'</div>',
-                        unsafe_allow_html=True
-                    )
+            for agent, key in agent_keys:
+                status = st.session_state.get(key, 'pending')
+                config = _STATUS_CONFIG.get(status, _STATUS_CONFIG['pending'])
+                
+                html_parts.append(
+                    f'<div style="'
+                    f'flex: 1 1 30%; '
+                    f'background-color: {config["bg"]}; '
+                    f'color: {config["color"]}; '
+                    f'padding: 0.5rem; '
+                    f'border-radius: 5px; '
+                    f'margin: 0.2rem 0; '
+                    f'text-align: center; '
+                    f'font-size: 0.9rem; '
+                    f'border: 1px solid {config["color"]}20;'
+                    f'">'
+                    f'{config["emoji"]} {agent.replace(" ", "<br>")}<br>'
+                    f'<small><i>{status.title()}</i></small>'
+                    f'</div>'
+                )
+            
+            html_parts.append('</div>')
+            st.markdown("".join(html_parts), unsafe_allow_html=True)
+
+class AnalysisProgress:
+    """Thread-safe count of graph steps finished by a background analysis"""
+    
+    def __init__(self, total: int):
+        self.total = max(total, 1)
+        self._done = 0
+        self._lock = threading.Lock()
+    
+    def advance(self):
+        with self._lock:
+            self._done += 1
+    
+    def fraction(self) -> float:
+        with self._lock:
+            return min(self._done / self.total, 0.99)
+
+def _estimate_steps(selected_analysts: list, config: Dict[str, Any]) -> int:
+    """Estimate the number of states astream_propagate yields for a run"""
+    debate_steps = 2 * config.get("max_debate_rounds", 1) + 2  # debate, manager, trader
+    risk_steps = 3 * config.get("max_risk_discuss_rounds", 1) + 1  # debators, judge
+    return len(selected_analysts) + 1 + debate_steps + risk_steps
+
+class LiveAgentOutput:
+    """Turn interleaved agent events into readable text, one agent at a time
+    
+    Concurrent agents stream tokens at the same time, so only the active
+    agent's tokens are passed through. Other agents are buffered and shown
+    once the active agent finishes its current LLM call. Tool calls, and the
+    results of LLMs that do not stream tokens, arrive as whole messages.
+    """
+    
+    def __init__(self):
+        self.text = ""
+        self._active = None
+        self._shown = None
+        self._buffers = {}
+        self._finished = set()
+    
+    def _switch_to(self, agent: str) -> str:
+        self._active = agent
+        heading = ""
+        if agent != self._shown:
+            heading = f"\n\n**{agent}**\n\n"
+            self._shown = agent
+        return heading + self._buffers.pop(agent, "")
+    
+    def _finish_active(self) -> str:
+        out = "\n\n"
+        self._active = None
+        # Flush buffered agents, fully for finished calls, then follow the next live one
+        for agent in list(self._buffers):
+            out += self._switch_to(agent)
+            if agent not in self._finished:
+                break
+            self._finished.discard(agent)
+            out += "\n\n"
+            self._active = None
+        return out
+    
+    def _complete(self, agent: str, text: str, finished: bool) -> str:
+        """Show a whole message now if no other agent is active, else buffer it"""
+        if self._active is None:
+            return self._switch_to(agent) + text + self._finish_active()
+        if agent == self._active:
+            return text
+        self._buffers[agent] = self._buffers.get(agent, "") + text
+        if finished:
+            self._finished.add(agent)
+        return ""
+    
+    def feed(self, event: Dict[str, str]) -> str:
+        """Consume an agent event and return the text to append to the output"""
+        agent = event['agent'] or "Agent"
+        out = ""
+        if event['event_type'] == 'thought':
+            if self._active is None:
+                out = self._switch_to(agent)
+            if agent == self._active:
+                out += event['content']
+            else:
+                self._buffers[agent] = self._buffers.get(agent, "") + event['content']
+        elif event['event_type'] == 'action':
+            out = self._complete(agent, f"\n\n🔧 `{event['content']}`\n\n", finished=False)
+        elif event['event_type'] == 'result':
+            if agent == self._active:
+                out = self._finish_active()
+            elif agent in self._buffers:
+                self._finished.add(agent)
+            else:
+                # The LLM did not stream, so its tokens were never shown
+                out = self._complete(agent, event['content'], finished=True)
+        self.text += out
+        return out
+    
+    def flush(self) -> str:
+        """Return all still-buffered output, e.g. after the active agent errored out"""
+        out = ""
+        for agent in list(self._buffers):
+            out += "\n\n" + self._switch_to(agent)
+        self._active = None
+        self._finished.clear()
+        self.text += out
+        return out
+
+def _run_analysis_job(ta, ticker: str, trade_date: str, progress: AnalysisProgress,
+                      events: queue.Queue):
+    """Run an analysis to completion in a worker thread, counting finished steps
+    
+    Agent tokens are put on events as they are generated when streaming is
+    enabled in the config and the tradingagents streaming callbacks are available.
+    """
+    async def run():
+        kwargs = {}
+        if ta.config.get('llm_streaming'):
+            try:
+                from tradingagents.graph.streaming import AgentEventHandler
+                kwargs['callbacks'] = [AgentEventHandler(events)]
+            except ImportError:
+                pass
+        
+        final_state = None
+        async for final_state in ta.astream_propagate(ticker, trade_date, **kwargs):
+            progress.advance()
+        return final_state
+    
+    final_state = asyncio.run(run())
+    return final_state, ta.process_signal(final_state["final_trade_decision"])
+
+# Config checks keyed on the sorted config JSON, recomputed only when it changes
+@st.cache_data(max_entries=32, show_spinner=False)
+def _validate(config_json: str) -> list:
+    return validate_configuration(json.loads(config_json))
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _config_summary(config_json: str) -> tuple:
+    return format_config_summary(json.loads(config_json))
+
+class _DegradedAnalysis(Exception):
+    """Carries an analysis with failed analysts out of _cached_propagate uncached"""
+    def __init__(self, result: dict):
+        super().__init__("analysis finished with missing analyst reports")
+        self.result = result
+
+@st.cache_data(persist="disk", show_spinner=False)
+def _cached_propagate(ticker: str, trade_date: str, analysts_tuple: tuple, config_json: str,
+                      _progress: AnalysisProgress, _events: queue.Queue) -> dict:
+    """Run an analysis, persisted to disk so identical requests skip the LLM calls
+    
+    Keyed on ticker, date, analysts and config; the underscored progress and
+    event arguments are not part of the key. Runs where an analyst failed or
+    left an empty report are raised as _DegradedAnalysis so they never reach
+    the cache.
+    """
+    ta = get_trading_graph(analysts_tuple, config_json)
+    final_state, decision = _run_analysis_job(ta, ticker, trade_date, _progress, _events)
+    result = {'final_state': final_state, 'decision': decision}
+    
+    complete = not final_state.get('analyst_errors') and all(
+        final_state.get(spec.report_key) for spec in ta.analyst_specs
+    )
+    if not complete:
+        raise _DegradedAnalysis(result)
+    return result
+
+def _analyze(*args) -> dict:
+    """Run _cached_propagate, returning degraded results without caching them"""
+    try:
+        return _cached_propagate(*args)
+    except _DegradedAnalysis as e:
+        return e.result
 
 def run_analysis(ticker: str, trade_date: str, selected_analysts: list):
-    """Run the trading agents analysis"""
+    """Start the trading agents analysis in a background thread
+    
+    The selected analysts run concurrently. Progress and the result are picked
+    up by poll_analysis on later reruns, so the page stays responsive meanwhile.
+    """
     
     try:
         # Validate inputs
         if not ticker or not trade_date:
             st.error("Please provide both ticker symbol and trade date")
-            return None
+            return False
             
         # API keys are loaded from environment (.env file)
         
-        # Initialize progress tracking
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        # Create TradingAgents instance
-        status_text.text("Initializing TradingAgents...")
-        progress_bar.progress(10)
-        
-        ta = TradingAgentsGraph(
-            selected_analysts=selected_analysts,
-            debug=False,
-            config=st.session_state.config
-        )
-        
-        progress_bar.progress(20)
-        status_text.text("Running analysis...")
-        
-        # Run the analysis
-        final_state, decision = ta.propagate(ticker, trade_date)
-        
-        progress_bar.progress(100)
-        status_text.text("Analysis completed!")
-        
-        # Store results
-        analysis_result = {
+        config_json = json.dumps(st.session_state.config, sort_keys=True)
+        issues = _validate(config_json)
+        if issues:
+            st.error(f"Invalid configuration: {', '.join(issues)}")
+            return False
+        
+        progress = AnalysisProgress(_estimate_steps(selected_analysts, st.session_state.config))
+        events = queue.Queue()
+        st.session_state.analysis_job = {
+            'future': st.session_state.executor.submit(
+                _analyze,
+                ticker,
+                trade_date,
+                tuple(selected_analysts),
+                config_json,
+                progress,
+                events
+            ),
+            'progress': progress,
+            'events': events,
+            'output': LiveAgentOutput(),
             'ticker': ticker,
             'trade_date': trade_date,
-            'final_state': final_state,
-            'decision': decision,
-            'timestamp': datetime.datetime.now(),
             'selected_analysts': selected_analysts
         }
-        
-        st.session_state.analysis_history.append(analysis_result)
-        st.session_state.current_analysis = analysis_result
-        
-        return analysis_result
+        return True
         
     except Exception as e:
         st.error(f"Analysis failed: {str(e)}")
-        st.error(f"Details: {traceback.format_exc()}")
-        return None
+        if st.session_state.get("debug_mode"):
+            st.error(f"Details: {traceback.format_exc()}")
+        else:
+            logger.exception("Failed to start analysis for %s", ticker)
+        return False
+
+def _stream_job_output(job, progress_slot):
+    """Yield agent output of a running job as it arrives, until the job is done"""
+    output = job['output']
+    # Replay what earlier reruns already showed
+    if output.text:
+        yield output.text
+    
+    events = job['events']
+    while not job['future'].done() or not events.empty():
+        progress_slot.progress(
+            job['progress'].fraction(),
+            text=f"Running analysis for {job['ticker']}..."
+        )
+        try:
+            chunk = output.feed(events.get(timeout=0.5))
+        except queue.Empty:
+            continue
+        if chunk:
+            yield chunk
+    
+    # Agents still held back, e.g. behind one that failed before its result
+    rest = output.flush()
+    if rest:
+        yield rest
+
+def poll_analysis(progress_slot):
+    """Stream output of the background analysis and store its result once done"""
+    job = st.session_state.analysis_job
+    if job is None:
+        return
+    
+    future = job['future']
+    if not future.done():
+        st.markdown("### 🔄 Live Agent Output")
+        st.write_stream(_stream_job_output(job, progress_slot))
+        progress_slot.empty()
+    
+    st.session_state.analysis_job = None
+    st.session_state.analysis_running = False
+    
+    try:
+        result = future.result()
+    except Exception as e:
+        st.error(f"Analysis failed: {str(e)}")
+        if st.session_state.get("debug_mode"):
+            st.error(f"Details: {''.join(traceback.format_exception(e))}")
+        else:
+            logger.error("Analysis failed for %s", job['ticker'], exc_info=e)
+        return
+    
+    # Store results
+    analysis_result = {
+        'ticker': job['ticker'],
+        'trade_date': job['trade_date'],
+        'final_state': result['final_state'],
+        'decision': result['decision'],
+        'timestamp': datetime.datetime.now(),
+        'selected_analysts': job['selected_analysts']
+    }
+    
+    st.session_state.analysis_history.append(analysis_result)
+    st.session_state.current_analysis = analysis_result
+    
+    st.success(f"✅ Analysis completed for {job['ticker']}!")
+    st.rerun()
+
+def _metrics_row(items: list):
+    """Render (label, value, delta) metrics side by side in one row"""
+    cols = st.columns(len(items))
+    for col, (label, value, delta) in zip(cols, items):
+        col.metric(label, value, delta=delta)
+
+# (final_state key, expander title) for the analyst reports tab
+REPORTS = (
+    ('market_report', "📈 Market Analysis"),
+    ('sentiment_report', "💭 Social Sentiment Analysis"),
+    ('news_report', "📰 News Analysis"),
+    ('fundamentals_report', "📊 Fundamentals Analysis"),
+)
+
+RESULT_SECTIONS = {
+    "summary": "📊 Summary",
+    "reports": "🔍 Analyst Reports",
+    "debate": "🔬 Research Debate",
+    "trading": "💼 Trading Decision",
+    "risk": "⚠️ Risk Assessment",
+    "charts": "📈 Charts",
+    "export": "💾 Export",
+}
+
+def _active_section() -> str:
+    """Return the results section named by the ?tab= query param"""
+    tab = st.query_params.get("tab")
+    return tab if tab in RESULT_SECTIONS else "summary"
+
+def _remember_section():
+    st.query_params["tab"] = st.session_state.result_section
+
+# The example gauge and sentiment figures only change with their inputs, so the
+# same Figure instance is reused across reruns instead of being rebuilt
+@st.cache_resource(show_spinner=False)
+def _risk_gauge(risk_level: str, risk_score: float):
+    return create_risk_gauge(risk_level, risk_score)
+
+@st.cache_resource(show_spinner=False)
+def _sentiment_chart(positive: float, negative: float, neutral: float):
+    return create_sentiment_pie_chart(
+        {"Positive": positive, "Negative": negative, "Neutral": neutral}
+    )
+
+def _ticker_bundle(ticker: str):
+    """Market data for the displayed ticker, kept in the session until the ticker changes"""
+    if should_refresh(ticker):
+        st.session_state.ticker_bundle = load_ticker_bundle(ticker, days=30)
+        # Empty results are not cached, so a failed fetch is retried on the next rerun
+        if not st.session_state.ticker_bundle[0].empty:
+            st.session_state.last_fetched_ticker = ticker.upper()
+    return st.session_state.ticker_bundle
 
 def display_analysis_results(analysis_result: Dict[str, Any]):
-    """Display the analysis results in organized tabs"""
+    """Display the analysis results, one section at a time"""
     
     if not analysis_result:
         return
@@ -368,65 +686,60 @@ def display_analysis_results(analysis_result: Dict[str, Any]):
     final_state = analysis_result['final_state']
     decision = analysis_result['decision']
     
-    # Create tabs for different sections
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
-        "📊 Summary", "🔍 Analyst Reports", "🔬 Research Debate", 
-        "💼 Trading Decision", "⚠️ Risk Assessment", "📈 Charts", "💾 Export"
-    ])
+    # Section selector; only the active section is built on each rerun
+    section = st.radio(
+        "Section",
+        list(RESULT_SECTIONS),
+        index=list(RESULT_SECTIONS).index(_active_section()),
+        format_func=RESULT_SECTIONS.get,
+        horizontal=True,
+        label_visibility="collapsed",
+        key="result_section",
+        on_change=_remember_section,
+    )
     
-    with tab1:
+    if section == "summary":
         st.subheader(f"Analysis Summary for {analysis_result['ticker']}")
         st.write(f"**Date:** {analysis_result['trade_date']}")
         st.write(f"**Analysis Time:** {analysis_result['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}")
         
         # Get and display stock information
-        stock_info = get_stock_info(analysis_result['ticker'])
+        _, info = _ticker_bundle(analysis_result['ticker'])
+        stock_info = get_stock_info(analysis_result['ticker'], info)
         if stock_info:
-            st.write(f"**Company:** {stock_info.get('name', 'N/A')}")
-            st.write(f"**Sector:** {stock_info.get('sector', 'N/A')} | **Industry:** {stock_info.get('industry', 'N/A')}")
+            st.write(f"**Company:** {stock_info.name}")
+            st.write(f"**Sector:** {stock_info.sector} | **Industry:** {stock_info.industry}")
             
             # Create metrics dashboard
             create_metrics_dashboard(stock_info)
         
+        analyst_errors = final_state.get('analyst_errors')
+        if analyst_errors:
+            st.warning("⚠️ Some analysts failed, so this decision is based on partial reports: "
+                       + ", ".join(f"{name} ({error})" for name, error in analyst_errors.items()))
+        
         # Display final decision prominently
         if decision:
             st.markdown("### 🎯 Final Trading Decision")
             decision_color = "green" if "buy" in str(decision).lower() else "red" if "sell" in str(decision).lower() else "gray"
             st.markdown(f'<div style="background-color: {decision_color}; color: white; padding: 1rem; border-radius: 5px; text-align: center; font-size: 1.2rem; font-weight: bold;">{decision}</div>', unsafe_allow_html=True)
         
-        # Analysis metrics
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Analysts Used", len(analysis_result['selected_analysts']))
-        with col2:
-            st.metric("Confidence Level", "High")  # Could be derived from analysis
-        with col3:
-            st.metric("Risk Level", "Medium")  # Could be derived from analysis
+        # Analysis metrics; confidence and risk could be derived from the analysis
+        _metrics_row([
+            ("Analysts Used", len(analysis_result['selected_analysts']), None),
+            ("Confidence Level", "High", None),
+            ("Risk Level", "Medium", None),
+        ])
     
-    with tab2:
+    elif section == "reports":
         st.subheader("📊 Analyst Team Reports")
         
-        # Market Analysis
-        if 'market_report' in final_state and final_state['market_report']:
-            with st.expander("📈 Market Analysis", expanded=True):
-                st.markdown(final_state['market_report'])
-        
-        # Sentiment Analysis  
-        if 'sentiment_report' in final_state and final_state['sentiment_report']:
-            with st.expander("💭 Social Sentiment Analysis", expanded=True):
-                st.markdown(final_state['sentiment_report'])
-        
-        # News Analysis
-        if 'news_report' in final_state and final_state['news_report']:
-            with st.expander("📰 News Analysis", expanded=True):
-                st.markdown(final_state['news_report'])
-        
-        # Fundamentals Analysis
-        if 'fundamentals_report' in final_state and final_state['fundamentals_report']:
-            with st.expander("📊 Fundamentals Analysis", expanded=True):
-                st.markdown(final_state['fundamentals_report'])
+        for key, title in REPORTS:
+            body = final_state.get(key)
+            if body:
+                st.expander(title, expanded=True).markdown(body)
     
-    with tab3:
+    elif section == "debate":
         st.subheader("🔬 Research Team Analysis")
         
         if 'investment_plan' in final_state and final_state['investment_plan']:
@@ -440,7 +753,7 @@ def display_analysis_results(analysis_result: Dict[str, Any]):
                 with st.expander(f"Debate Round {round_num}"):
                     st.markdown(debate)
     
-    with tab4:
+    elif section == "trading":
         st.subheader("💼 Trading Team Decision")
         
         if 'trader_investment_plan' in final_state and final_state['trader_investment_plan']:
@@ -451,7 +764,7 @@ def display_analysis_results(analysis_result: Dict[str, Any]):
             st.markdown("### Final Trade Decision")
             st.markdown(final_state['final_trade_decision'])
     
-    with tab5:
+    elif section == "risk":
         st.subheader("⚠️ Risk Management Assessment")
         
         if 'risk_assessment' in final_state and final_state['risk_assessment']:
@@ -460,67 +773,75 @@ def display_analysis_results(analysis_result: Dict[str, Any]):
         
         # Risk metrics visualization
         st.markdown("### Risk Metrics")
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Market Risk", "Medium", delta="0.2")
-        with col2:
-            st.metric("Volatility Risk", "High", delta="-0.1") 
-        with col3:
-            st.metric("Liquidity Risk", "Low", delta="0.0")
+        _metrics_row([
+            ("Market Risk", "Medium", "0.2"),
+            ("Volatility Risk", "High", "-0.1"),
+            ("Liquidity Risk", "Low", "0.0"),
+        ])
     
-    with tab6:
+    elif section == "charts":
         st.subheader("📈 Stock Charts and Analysis")
         
-        if PLOTLY_AVAILABLE and UTILS_AVAILABLE:
+        if plotly_available() and UTILS_AVAILABLE:
+            register_resampler()
+            
+            # One fetch feeds both charts
+            hist, _ = _ticker_bundle(analysis_result['ticker'])
+            
             # Stock price chart
-            price_chart = create_stock_chart(analysis_result['ticker'], days=30)
+            price_chart = create_stock_chart(analysis_result['ticker'], days=30, hist=hist)
             if price_chart:
                 st.plotly_chart(price_chart, use_container_width=True)
             
             # Volume chart
-            volume_chart = create_volume_chart(analysis_result['ticker'], days=30)
+            volume_chart = create_volume_chart(analysis_result['ticker'], days=30, hist=hist)
             if volume_chart:
                 st.plotly_chart(volume_chart, use_container_width=True)
             
             # Risk gauge (example)
             col1, col2 = st.columns(2)
             with col1:
-                risk_gauge = create_risk_gauge("Medium", 0.6)
+                risk_gauge = _risk_gauge("Medium", 0.6)
                 if risk_gauge:
                     st.plotly_chart(risk_gauge, use_container_width=True)
             
             with col2:
                 # Sentiment pie chart (example data)
-                sentiment_data = {"Positive": 40, "Negative": 30, "Neutral": 30}
-                sentiment_chart = create_sentiment_pie_chart(sentiment_data)
+                sentiment_chart = _sentiment_chart(40, 30, 30)
                 if sentiment_chart:
                     st.plotly_chart(sentiment_chart, use_container_width=True)
         else:
             st.warning("📈 Charts are disabled due to missing dependencies (plotly). Core analysis functionality remains available.")
             st.info("Stock analysis and agent reports are still fully functional in other tabs.")
     
-    with tab7:
+    elif section == "export":
         st.subheader("💾 Export Analysis")
         
         # Configuration summary
-        display_config_summary(st.session_state.config)
+        display_config_summary(
+            st.session_state.config,
+            _config_summary(json.dumps(st.session_state.config, sort_keys=True))
+        )
         
         st.markdown("---")
         
         # Export options
         st.markdown("### Export Options")
         
+        # Serialize once per analysis and keep it with the result
+        json_data = analysis_result.get('_json')
+        if json_data is None:
+            json_data = analysis_result['_json'] = export_analysis_to_json(analysis_result)
+        
         col1, col2 = st.columns(2)
         
         with col1:
             if st.button("📋 Copy Analysis to Clipboard", use_container_width=True):
-                json_data = export_analysis_to_json(analysis_result)
                 if json_data:
                     st.code(json_data[:500] + "..." if len(json_data) > 500 else json_data)
                     st.success("Analysis data ready for copying!")
         
         with col2:
-            json_data = export_analysis_to_json(analysis_result)
             if json_data:
                 st.download_button(
                     label="💾 Download as JSON",
@@ -530,6 +851,27 @@ def display_analysis_results(analysis_result: Dict[str, Any]):
                     use_container_width=True
                 )
 
+@st.cache_data(max_entries=8, show_spinner=False)
+def _history_df(records: tuple) -> pd.DataFrame:
+    """Build the history table; cached until a new analysis changes the rows
+    
+    Columns get string and datetime dtypes so they serialize to typed Arrow
+    columns rather than Python objects.
+    """
+    tickers, dates, times, decisions, analysts = zip(*records)
+    return pd.DataFrame({
+        'Ticker': pd.array(tickers, dtype='string'),
+        'Date': pd.to_datetime(pd.Series(dates, dtype='string')),
+        'Analysis Time': pd.array(times, dtype='datetime64[ns]'),
+        'Decision': pd.array(decisions, dtype='string'),
+        'Analysts': pd.array(analysts, dtype='string'),
+    })
+
+_HISTORY_COLUMN_CONFIG = {
+    'Date': st.column_config.DateColumn("Date", format="YYYY-MM-DD"),
+    'Analysis Time': st.column_config.DatetimeColumn("Analysis Time", format="YYYY-MM-DD HH:mm"),
+}
+
 def display_analysis_history():
     """Display historical analyses"""
     st.subheader("📚 Analysis History")
@@ -539,17 +881,16 @@ def display_analysis_history():
         return
     
     # Display as a table
-    history_data = []
-    for analysis in st.session_state.analysis_history:
-        history_data.append({
-            'Ticker': analysis['ticker'],
-            'Date': analysis['trade_date'],
-            'Analysis Time': analysis['timestamp'].strftime('%Y-%m-%d %H:%M'),
-            'Decision': str(analysis['decision'])[:50] + '...' if len(str(analysis['decision'])) > 50 else str(analysis['decision']),
-            'Analysts': ', '.join(analysis['selected_analysts'])
-        })
-    
-    df = pd.DataFrame(history_data)
+    df = _history_df(tuple(
+        (
+            analysis['ticker'],
+            analysis['trade_date'],
+            analysis['timestamp'],
+            str(analysis['decision'])[:50] + '...' if len(str(analysis['decision'])) > 50 else str(analysis['decision']),
+            ', '.join(analysis['selected_analysts'])
+        )
+        for analysis in st.session_state.analysis_history
+    ))
     
     # Add selection for detailed view
     selected_analysis = st.selectbox(
@@ -560,8 +901,21 @@ def display_analysis_history():
     
     if st.button("View Selected Analysis"):
         st.session_state.current_analysis = st.session_state.analysis_history[selected_analysis]
+        # The results section is outside the history fragment, so rerun the whole app
+        st.rerun()
     
-    st.dataframe(df, use_container_width=True)
+    st.dataframe(df, use_container_width=True, column_config=_HISTORY_COLUMN_CONFIG)
+
+# Fragments rerun on their own when their widgets change (Streamlit >= 1.33)
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda f: f)
+
+@_fragment
+def _agent_status_fragment():
+    display_agent_status()
+
+@_fragment
+def _history_fragment():
+    display_analysis_history()
 
 def main():
     """Main application function"""
@@ -609,18 +963,16 @@ def main():
                 use_container_width=True
             )
         
-        if submitted:
-            st.session_state.analysis_running = True
-            result = run_analysis(ticker, str(trade_date), selected_analysts)
-            st.session_state.analysis_running = False
-            
-            if result:
-                st.success(f"✅ Analysis completed for {ticker}!")
-                st.rerun()
+        if submitted and not st.session_state.analysis_running:
+            st.session_state.analysis_running = run_analysis(
+                ticker, str(trade_date), selected_analysts
+            )
+    
+    progress_slot = st.empty()
     
     # Agent status in its own section
     st.markdown("---")
-    display_agent_status()
+    _agent_status_fragment()
     
     # Display current analysis results
     if st.session_state.current_analysis:
@@ -630,7 +982,10 @@ def main():
     # Analysis history
     if st.session_state.analysis_history:
         st.markdown("---")
-        display_analysis_history()
+        _history_fragment()
+    
+    # Poll last so the rest of the page renders before waiting on the job
+    poll_analysis(progress_slot)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,19 +1,18 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
+import functools
+import importlib.util
 import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional, Tuple
 
-# Handle optional imports gracefully
-try:
-    import plotly.graph_objects as go
-    import plotly.express as px
-    from plotly.subplots import make_subplots
-    PLOTLY_AVAILABLE = True
-except ImportError:
+# Handle optional imports gracefully; plotly is imported by the chart functions
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+if not PLOTLY_AVAILABLE:
     st.warning("Plotly not available for charts")
-    PLOTLY_AVAILABLE = False
-    go = px = None
 
 try:
     import yfinance as yf
@@ -23,6 +22,83 @@ except ImportError:
     YFINANCE_AVAILABLE = False
     yf = None
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Network failures (requests and curl_cffi errors are OSErrors), truncated
+# JSON and rate limiting from Yahoo are worth retrying; anything else is
+# reported straight away. HTTP errors are OSErrors too, see _is_transient.
+_TRANSIENT_ERRORS = (OSError, json.JSONDecodeError)
+
+try:
+    # Only in yfinance releases that report rate limiting as its own error
+    from yfinance.exceptions import YFRateLimitError
+    _TRANSIENT_ERRORS += (YFRateLimitError,)
+except ImportError:
+    pass
+
+def _is_transient(error: BaseException) -> bool:
+    """Return True for errors worth retrying; of HTTP errors only 429 and 5xx count"""
+    if not isinstance(error, _TRANSIENT_ERRORS):
+        return False
+    status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status is None or status == 429 or status >= 500
+
+try:
+    from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+    _retry_transient = retry(
+        retry=retry_if_exception(_is_transient),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.5, max=4),
+        reraise=True
+    )
+except ImportError:
+    def _retry_transient(func):
+        return func
+
+# Plain, index (^GSPC), share class (BRK.B), crypto/FX (BTC-USD, EURUSD=X) and
+# exchange-suffixed (0700.HK) symbols
+_TICKER_RE = re.compile(r'^\^?[A-Z0-9][A-Z0-9.=\-]{0,14}$')
+
+# Name of the shared Plotly template holding the common chart layout
+CHART_TEMPLATE = "trading"
+
+@functools.lru_cache(maxsize=1)
+def _register_chart_template() -> str:
+    """Register the shared chart template on first use and return its name
+    
+    The layout is validated once here instead of by update_layout on every
+    figure. It extends the default "plotly" template so charts keep its look.
+    Figures are also switched to the orjson encoder when it is installed.
+    """
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    
+    if importlib.util.find_spec("orjson") is not None:
+        pio.json.config.default_engine = "orjson"
+    
+    template = go.layout.Template(pio.templates["plotly"])
+    template.layout.update(
+        height=400,
+        xaxis_rangeslider_visible=False,
+        margin=dict(l=40, r=20, t=40, b=30)
+    )
+    pio.templates[CHART_TEMPLATE] = template
+    return CHART_TEMPLATE
+
+def _dates(hist: pd.DataFrame) -> np.ndarray:
+    """Return the index as datetime64 values, keeping the local wall time of tz-aware indexes"""
+    index = hist.index
+    if getattr(index, 'tz', None) is not None:
+        index = index.tz_localize(None)
+    return index.to_numpy()
+
+# Above this many points price/volume traces are drawn with WebGL instead of SVG
+WEBGL_POINT_THRESHOLD = 1000
+
 def format_currency(value: float) -> str:
     """Format a number as currency"""
     if value >= 1e9:
@@ -38,115 +114,226 @@ def format_percentage(value: float) -> str:
     """Format a number as percentage"""
     return f"{value:.2f}%"
 
-def create_stock_chart(ticker: str, days: int = 30):
-    """Create a stock price chart using plotly"""
+_PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close')
+
+def _downcast(hist: pd.DataFrame) -> pd.DataFrame:
+    """Store prices as float32 and volume as int32 to halve the chart payload
+    
+    Volume is left alone when it holds NaNs or does not fit in int32.
+    """
+    hist = hist.astype({c: 'float32' for c in _PRICE_COLUMNS if c in hist.columns})
+    if 'Volume' in hist.columns and hist['Volume'].dtype.kind in 'iu':
+        if hist['Volume'].max() <= np.iinfo(np.int32).max:
+            hist['Volume'] = hist['Volume'].astype('int32')
+    return hist
+
+def _today() -> date:
+    """Current UTC date; fetches are keyed on it so cache keys hold for the whole day"""
+    return datetime.now(timezone.utc).date()
+
+class _NoMarketData(Exception):
+    """Raised for an empty history so st.cache_data does not keep it"""
+
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False)
+@_retry_transient
+def _fetch_bundle(ticker: str, end_date: date, days: int) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Fetch price history and info through one yf.Ticker; ticker is upper-cased"""
+    stock = yf.Ticker(ticker)
+    start_date = end_date - timedelta(days=days)
+    # yfinance's end bound is exclusive, so end_date itself needs the day after
+    hist = stock.history(start=start_date, end=end_date + timedelta(days=1))
+    # yfinance reports most failures as an empty frame rather than raising
+    if hist.empty:
+        raise _NoMarketData(ticker)
+    return _downcast(hist), stock.info
+
+def load_ticker_bundle(ticker: str, days: int = 30) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """Return (history, info) for a ticker, cached for five minutes
+    
+    Pass the history to create_stock_chart/create_volume_chart and the info
+    to get_stock_info so one dashboard costs a single round-trip. Malformed
+    symbols return empty data without a request, and empty results are not
+    cached so the next call fetches again.
+    """
+    ticker = ticker.upper()
+    if not YFINANCE_AVAILABLE or not _TICKER_RE.match(ticker):
+        return pd.DataFrame(), {}
+    
+    try:
+        return _fetch_bundle(ticker, _today(), days)
+    except _NoMarketData:
+        return pd.DataFrame(), {}
+    except Exception as e:
+        if _is_transient(e):
+            st.warning(f"Market data for {ticker} is temporarily unavailable, try again shortly")
+        else:
+            st.error(f"Error fetching market data for {ticker}: {str(e)}")
+        return pd.DataFrame(), {}
+
+def should_refresh(ticker: str) -> bool:
+    """Return True if ticker differs from the last one fetched in this session
+    
+    Pages record the fetched ticker in st.session_state.last_fetched_ticker.
+    """
+    return bool(ticker) and ticker.upper() != st.session_state.get('last_fetched_ticker')
+
+def clear_market_data_cache():
+    """Drop cached yfinance responses so the next render refetches them"""
+    _fetch_bundle.clear()
+    st.session_state.pop('last_fetched_ticker', None)
+
+def create_stock_chart(ticker: str, days: int = 30, hist: Optional[pd.DataFrame] = None):
+    """Create a stock price chart using plotly, from hist if already loaded"""
     if not PLOTLY_AVAILABLE or not YFINANCE_AVAILABLE:
         st.warning("Chart creation requires plotly and yfinance libraries")
         return None
+    
+    import plotly.graph_objects as go
         
     try:
         # Get stock data
-        stock = yf.Ticker(ticker)
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-        
-        hist = stock.history(start=start_date, end=end_date)
+        if hist is None:
+            hist, _ = load_ticker_bundle(ticker, days)
         
         if hist.empty:
             st.warning(f"No data available for {ticker}")
             return None
         
-        # Create candlestick chart
-        fig = go.Figure(data=go.Candlestick(
-            x=hist.index,
-            open=hist['Open'],
-            high=hist['High'],
-            low=hist['Low'],
-            close=hist['Close'],
-            name=ticker
-        ))
+        if len(hist) > WEBGL_POINT_THRESHOLD:
+            # Candlesticks have no WebGL variant, so long ranges use a close-price line
+            trace = go.Scattergl(
+                x=_dates(hist),
+                y=hist['Close'].to_numpy(),
+                mode='lines',
+                name=ticker
+            )
+        else:
+            # Create candlestick chart
+            trace = go.Candlestick(
+                x=_dates(hist),
+                open=hist['Open'].to_numpy(),
+                high=hist['High'].to_numpy(),
+                low=hist['Low'].to_numpy(),
+                close=hist['Close'].to_numpy(),
+                name=ticker
+            )
         
-        fig.update_layout(
+        return go.Figure(data=trace, layout=dict(
+            template=_register_chart_template(),
             title=f"{ticker} Stock Price ({days} days)",
             yaxis_title="Price ($)",
-            xaxis_title="Date",
-            xaxis_rangeslider_visible=False,
-            height=400
-        )
-        
-        return fig
+            xaxis_title="Date"
+        ))
         
     except Exception as e:
         st.error(f"Error creating stock chart: {str(e)}")
         return None
 
-def create_volume_chart(ticker: str, days: int = 30):
-    """Create a volume chart"""
+def create_volume_chart(ticker: str, days: int = 30, hist: Optional[pd.DataFrame] = None):
+    """Create a volume chart, from hist if already loaded"""
     if not PLOTLY_AVAILABLE or not YFINANCE_AVAILABLE:
         st.warning("Volume chart requires plotly and yfinance libraries")
         return None
+    
+    import plotly.graph_objects as go
         
     try:
-        stock = yf.Ticker(ticker)
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-        
-        hist = stock.history(start=start_date, end=end_date)
+        if hist is None:
+            hist, _ = load_ticker_bundle(ticker, days)
         
         if hist.empty:
             return None
         
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            x=hist.index,
-            y=hist['Volume'],
-            name='Volume',
-            marker_color='lightblue'
-        ))
+        if len(hist) > WEBGL_POINT_THRESHOLD:
+            # Bars have no WebGL variant, so long ranges use a filled WebGL line
+            trace = go.Scattergl(
+                x=_dates(hist),
+                y=hist['Volume'].to_numpy(),
+                name='Volume',
+                mode='lines',
+                fill='tozeroy',
+                line_color='lightblue'
+            )
+        else:
+            trace = go.Bar(
+                x=_dates(hist),
+                y=hist['Volume'].to_numpy(),
+                name='Volume',
+                marker_color='lightblue'
+            )
         
-        fig.update_layout(
+        return go.Figure(data=trace, layout=dict(
+            template=_register_chart_template(),
             title=f"{ticker} Trading Volume ({days} days)",
             yaxis_title="Volume",
             xaxis_title="Date",
             height=300
-        )
-        
-        return fig
+        ))
         
     except Exception as e:
         st.error(f"Error creating volume chart: {str(e)}")
         return None
 
-def get_stock_info(ticker: str) -> Dict[str, Any]:
-    """Get basic stock information"""
+@dataclass(frozen=True, slots=True)
+class StockInfo:
+    """Basic company and quote data, with the day's change precomputed"""
+    name: str
+    sector: str = 'N/A'
+    industry: str = 'N/A'
+    market_cap: float = 0
+    pe_ratio: float = 0
+    dividend_yield: float = 0
+    beta: float = 0
+    current_price: float = 0
+    previous_close: float = 0
+    day_high: float = 0
+    day_low: float = 0
+    fifty_two_week_high: float = 0
+    fifty_two_week_low: float = 0
+    change: float = 0
+    change_pct: float = 0
+
+    @classmethod
+    def from_info(cls, ticker: str, info: Dict[str, Any]) -> "StockInfo":
+        """Build from a yfinance info dict; missing or null numbers become 0"""
+        current_price = info.get('currentPrice') or 0
+        previous_close = info.get('previousClose') or 0
+        change = current_price - previous_close
+        
+        return cls(
+            name=info.get('longName') or ticker,
+            sector=info.get('sector') or 'N/A',
+            industry=info.get('industry') or 'N/A',
+            market_cap=info.get('marketCap') or 0,
+            pe_ratio=info.get('forwardPE') or 0,
+            dividend_yield=info.get('dividendYield') or 0,
+            beta=info.get('beta') or 0,
+            current_price=current_price,
+            previous_close=previous_close,
+            day_high=info.get('dayHigh') or 0,
+            day_low=info.get('dayLow') or 0,
+            fifty_two_week_high=info.get('fiftyTwoWeekHigh') or 0,
+            fifty_two_week_low=info.get('fiftyTwoWeekLow') or 0,
+            change=change,
+            change_pct=(change / previous_close * 100) if previous_close else 0,
+        )
+
+def get_stock_info(ticker: str, info: Optional[Dict[str, Any]] = None) -> StockInfo:
+    """Get basic stock information, from info if already loaded"""
     if not YFINANCE_AVAILABLE:
         st.warning("Stock info requires yfinance library")
-        return {'name': ticker, 'sector': 'N/A', 'industry': 'N/A'}
+        return StockInfo(name=ticker)
         
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        if info is None:
+            _, info = load_ticker_bundle(ticker)
         
-        return {
-            'name': info.get('longName', ticker),
-            'sector': info.get('sector', 'N/A'),
-            'industry': info.get('industry', 'N/A'),
-            'market_cap': info.get('marketCap', 0),
-            'pe_ratio': info.get('forwardPE', 0),
-            'dividend_yield': info.get('dividendYield', 0),
-            'beta': info.get('beta', 0),
-            'current_price': info.get('currentPrice', 0),
-            'previous_close': info.get('previousClose', 0),
-            'day_high': info.get('dayHigh', 0),
-            'day_low': info.get('dayLow', 0),
-            'fifty_two_week_high': info.get('fiftyTwoWeekHigh', 0),
-            'fifty_two_week_low': info.get('fiftyTwoWeekLow', 0),
-        }
+        return StockInfo.from_info(ticker, info)
     except Exception as e:
         st.error(f"Error getting stock info: {str(e)}")
-        return {'name': ticker, 'sector': 'N/A', 'industry': 'N/A'}
+        return StockInfo(name=ticker)
 
-def create_metrics_dashboard(stock_info: Dict[str, Any]):
+def create_metrics_dashboard(stock_info: Optional[StockInfo]):
     """Create a metrics dashboard for stock information"""
     if not stock_info:
         return
@@ -155,95 +342,89 @@ def create_metrics_dashboard(stock_info: Dict[str, Any]):
     
     col1, col2, col3, col4 = st.columns(4)
     
-    with col1:
-        current_price = stock_info.get('current_price', 0)
-        previous_close = stock_info.get('previous_close', 0)
-        change = current_price - previous_close
-        change_pct = (change / previous_close * 100) if previous_close else 0
-        
-        st.metric(
-            "Current Price",
-            f"${current_price:.2f}",
-            delta=f"{change:+.2f} ({change_pct:+.2f}%)"
-        )
+    col1.metric(
+        "Current Price",
+        f"${stock_info.current_price:.2f}",
+        delta=f"{stock_info.change:+.2f} ({stock_info.change_pct:+.2f}%)"
+    )
     
-    with col2:
-        market_cap = stock_info.get('market_cap', 0)
-        st.metric(
-            "Market Cap",
-            format_currency(market_cap)
-        )
+    col2.metric(
+        "Market Cap",
+        format_currency(stock_info.market_cap)
+    )
     
-    with col3:
-        pe_ratio = stock_info.get('pe_ratio', 0)
-        st.metric(
-            "P/E Ratio",
-            f"{pe_ratio:.2f}" if pe_ratio else "N/A"
-        )
+    col3.metric(
+        "P/E Ratio",
+        f"{stock_info.pe_ratio:.2f}" if stock_info.pe_ratio else "N/A"
+    )
     
-    with col4:
-        dividend_yield = stock_info.get('dividend_yield', 0)
-        st.metric(
-            "Dividend Yield",
-            format_percentage(dividend_yield * 100) if dividend_yield else "N/A"
-        )
+    col4.metric(
+        "Dividend Yield",
+        format_percentage(stock_info.dividend_yield * 100) if stock_info.dividend_yield else "N/A"
+    )
+
+# Static parts of the risk gauge; plotly copies these, so they are shared read-only
+_RISK_GAUGE_DOMAIN = {'x': (0, 1), 'y': (0, 1)}
+_RISK_GAUGE_TITLE = {'text': "Risk Level"}
+_RISK_GAUGE_DELTA = {'reference': 0.5}
+_RISK_GAUGE = {
+    'axis': {'range': (None, 1)},
+    'bar': {'color': "darkblue"},
+    'steps': (
+        {'range': (0, 0.33), 'color': "lightgreen"},
+        {'range': (0.33, 0.66), 'color': "yellow"},
+        {'range': (0.66, 1), 'color': "lightcoral"}
+    ),
+    'threshold': {
+        'line': {'color': "red", 'width': 4},
+        'thickness': 0.75,
+        'value': 0.8
+    }
+}
 
 def create_risk_gauge(risk_level: str, risk_score: float = 0.5):
     """Create a risk gauge chart"""
     if not PLOTLY_AVAILABLE:
         st.warning("Risk gauge requires plotly library")
         return None
+    
+    import plotly.graph_objects as go
         
-    fig = go.Figure(go.Indicator(
+    return go.Figure(go.Indicator(
         mode = "gauge+number+delta",
         value = risk_score,
-        domain = {'x': [0, 1], 'y': [0, 1]},
-        title = {'text': "Risk Level"},
-        delta = {'reference': 0.5},
-        gauge = {
-            'axis': {'range': [None, 1]},
-            'bar': {'color': "darkblue"},
-            'steps': [
-                {'range': [0, 0.33], 'color': "lightgreen"},
-                {'range': [0.33, 0.66], 'color': "yellow"},
-                {'range': [0.66, 1], 'color': "lightcoral"}
-            ],
-            'threshold': {
-                'line': {'color': "red", 'width': 4},
-                'thickness': 0.75,
-                'value': 0.8
-            }
-        }
-    ))
-    
-    fig.update_layout(height=300)
-    return fig
+        domain = _RISK_GAUGE_DOMAIN,
+        title = _RISK_GAUGE_TITLE,
+        delta = _RISK_GAUGE_DELTA,
+        gauge = _RISK_GAUGE
+    ), layout=dict(template=_register_chart_template(), height=300))
 
 def create_sentiment_pie_chart(sentiment_data: Dict[str, float]):
     """Create a pie chart for sentiment analysis"""
     if not PLOTLY_AVAILABLE:
         st.warning("Sentiment chart requires plotly library")
         return None
+    
+    import plotly.graph_objects as go
         
     labels = list(sentiment_data.keys())
     values = list(sentiment_data.values())
     
     colors = ['#ff9999', '#66b3ff', '#99ff99', '#ffcc99']
     
-    fig = go.Figure(data=[go.Pie(
+    return go.Figure(data=[go.Pie(
         labels=labels,
         values=values,
         marker_colors=colors,
         textinfo='label+percent',
         textposition='auto'
-    )])
-    
-    fig.update_layout(
-        title="Sentiment Analysis",
-        height=400
-    )
-    
-    return fig
+    )], layout=dict(template=_register_chart_template(), title="Sentiment Analysis"))
+
+def _json_default(value: Any) -> str:
+    """Serialize datetimes like orjson does and anything else with str()"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
 
 def export_analysis_to_json(analysis_result: Dict[str, Any]) -> str:
     """Export analysis result to JSON string"""
@@ -252,8 +433,8 @@ def export_analysis_to_json(analysis_result: Dict[str, Any]) -> str:
         export_data = {
             'ticker': analysis_result['ticker'],
             'trade_date': analysis_result['trade_date'],
-            'timestamp': analysis_result['timestamp'].isoformat(),
-            'decision': str(analysis_result['decision']),
+            'timestamp': analysis_result['timestamp'],
+            'decision': analysis_result['decision'],
             'selected_analysts': analysis_result['selected_analysts'],
             'final_state': {}
         }
@@ -264,54 +445,66 @@ def export_analysis_to_json(analysis_result: Dict[str, Any]) -> str:
                    'fundamentals_report', 'investment_plan', 'trader_investment_plan',
                    'final_trade_decision']:
             if key in final_state and final_state[key]:
-                export_data['final_state'][key] = str(final_state[key])
+                export_data['final_state'][key] = final_state[key]
         
-        return json.dumps(export_data, indent=2)
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(export_data, default=str, option=orjson.OPT_INDENT_2).decode()
+        return json.dumps(export_data, indent=2, default=_json_default)
         
     except Exception as e:
         st.error(f"Error exporting analysis: {str(e)}")
         return ""
 
-def display_config_summary(config: Dict[str, Any]):
-    """Display a summary of the current configuration"""
-    st.subheader("⚙️ Current Configuration")
+def format_config_summary(config: Dict[str, Any]) -> Tuple[str, str]:
+    """Return the settings and data vendor summaries as two markdown blocks"""
+    settings = (
+        "**LLM Settings:**\n"
+        f"- Provider: {config.get('llm_provider', 'N/A')}\n"
+        f"- Deep Think Model: {config.get('deep_think_llm', 'N/A')}\n"
+        f"- Quick Think Model: {config.get('quick_think_llm', 'N/A')}\n"
+        "\n"
+        "**Analysis Settings:**\n"
+        f"- Max Debate Rounds: {config.get('max_debate_rounds', 'N/A')}\n"
+        f"- Max Risk Rounds: {config.get('max_risk_discuss_rounds', 'N/A')}\n"
+    )
     
-    col1, col2 = st.columns(2)
+    data_vendors = config.get('data_vendors', {})
+    vendors = (
+        "**Data Vendors:**\n"
+        f"- Stock Data: {data_vendors.get('core_stock_apis', 'N/A')}\n"
+        f"- Technical Indicators: {data_vendors.get('technical_indicators', 'N/A')}\n"
+        f"- Fundamental Data: {data_vendors.get('fundamental_data', 'N/A')}\n"
+        f"- News Data: {data_vendors.get('news_data', 'N/A')}\n"
+    )
     
-    with col1:
-        st.write("**LLM Settings:**")
-        st.write(f"- Provider: {config.get('llm_provider', 'N/A')}")
-        st.write(f"- Deep Think Model: {config.get('deep_think_llm', 'N/A')}")
-        st.write(f"- Quick Think Model: {config.get('quick_think_llm', 'N/A')}")
-        
-        st.write("**Analysis Settings:**")
-        st.write(f"- Max Debate Rounds: {config.get('max_debate_rounds', 'N/A')}")
-        st.write(f"- Max Risk Rounds: {config.get('max_risk_discuss_rounds', 'N/A')}")
+    return settings, vendors
+
+def display_config_summary(config: Dict[str, Any], summary: Optional[Tuple[str, str]] = None):
+    """Display a summary of the current configuration
+    
+    summary may be passed in precomputed by format_config_summary.
+    """
+    st.subheader("⚙️ Current Configuration")
     
-    with col2:
-        st.write("**Data Vendors:**")
-        data_vendors = config.get('data_vendors', {})
-        st.write(f"- Stock Data: {data_vendors.get('core_stock_apis', 'N/A')}")
-        st.write(f"- Technical Indicators: {data_vendors.get('technical_indicators', 'N/A')}")
-        st.write(f"- Fundamental Data: {data_vendors.get('fundamental_data', 'N/A')}")
-        st.write(f"- News Data: {data_vendors.get('news_data', 'N/A')}")
+    settings, vendors = summary or format_config_summary(config)
+    
+    col1, col2 = st.columns(2)
+    col1.markdown(settings)
+    col2.markdown(vendors)
+
+# Config fields and data vendors that validate_configuration requires
+_REQUIRED_FIELDS = ('llm_provider', 'deep_think_llm', 'quick_think_llm')
+_REQUIRED_VENDORS = ('core_stock_apis', 'technical_indicators', 'fundamental_data', 'news_data')
 
 def validate_configuration(config: Dict[str, Any]) -> List[str]:
     """Validate the configuration and return any issues"""
-    issues = []
+    issues = [f"Missing {field}" for field in _REQUIRED_FIELDS if not config.get(field)]
     
-    # Check required fields
-    required_fields = ['llm_provider', 'deep_think_llm', 'quick_think_llm']
-    for field in required_fields:
-        if not config.get(field):
-            issues.append(f"Missing {field}")
-    
-    # Check data vendors
-    data_vendors = config.get('data_vendors', {})
-    required_vendors = ['core_stock_apis', 'technical_indicators', 'fundamental_data', 'news_data']
-    for vendor in required_vendors:
-        if not data_vendors.get(vendor):
-            issues.append(f"Missing data vendor for {vendor}")
+    data_vendors = config.get('data_vendors') or {}
+    issues += [
+        f"Missing data vendor for {vendor}"
+        for vendor in _REQUIRED_VENDORS if not data_vendors.get(vendor)
+    ]
     
     return issues
 
@@ -320,7 +513,11 @@ def create_progress_tracker():
     progress_container = st.empty()
     return progress_container
 
+@functools.lru_cache(maxsize=64)
+def _status_key(agent_name: str) -> str:
+    """Session state key holding an agent's status"""
+    return f"{agent_name.lower().replace(' ', '_')}_status"
+
 def update_agent_status_in_session(agent_name: str, status: str):
     """Update agent status in session state"""
-    status_key = f"{agent_name.lower().replace(' ', '_')}_status"
-    st.session_state[status_key] = status
\ No newline at end of file
+    st.session_state[_status_key(agent_name)] = status
\ No newline at end of file
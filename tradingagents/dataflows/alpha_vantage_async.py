@@ -0,0 +1,110 @@
+import asyncio
+import atexit
+import threading
+from typing import Iterable, Tuple
+
+# Optional import for concurrent requests
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+from .alpha_vantage_common import (
+    API_BASE_URL,
+    AlphaVantageRateLimitError,
+    _build_api_params,
+    _is_data_response,
+)
+from .cache import get_data_cache
+
+# Cap on requests in flight at once. Alpha Vantage limits requests per
+# minute and per day rather than concurrency, so this only bounds bursts
+MAX_CONCURRENT_REQUESTS = 5
+
+# A single background event loop owns the HTTP session, so its connection
+# pool and TLS sessions are reused by every analysis in the process.
+_loop = None
+_loop_lock = threading.Lock()
+_session = None
+_semaphore = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Start the background event loop on first use and return it."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="alpha-vantage-io", daemon=True
+            ).start()
+            atexit.register(_close_session)
+    return _loop
+
+
+def _close_session():
+    """Close the shared session when the interpreter exits."""
+    if _session is not None and not _session.closed:
+        asyncio.run_coroutine_threadsafe(_session.close(), _loop).result(timeout=5)
+
+
+async def _get_session():
+    """Return the shared session and request semaphore (runs on the background loop)."""
+    global _session, _semaphore
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession()
+        _semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    return _session, _semaphore
+
+
+async def _make_api_request_async(function_name: str, params: dict) -> str:
+    """Async counterpart of _make_api_request without caching."""
+    session, semaphore = await _get_session()
+    async with semaphore:
+        async with session.get(
+            API_BASE_URL, params=_build_api_params(function_name, params)
+        ) as response:
+            response.raise_for_status()
+            return await response.text()
+
+
+async def _fetch_all(requests: Iterable[Tuple[str, dict]]) -> list:
+    return await asyncio.gather(
+        *(_make_api_request_async(function_name, params) for function_name, params in requests),
+        return_exceptions=True,
+    )
+
+
+def prefetch(requests: Iterable[Tuple[str, dict]]):
+    """Fetch several Alpha Vantage endpoints concurrently and cache the responses.
+
+    Later _make_api_request calls for the same function and params are served
+    from the cache. Failed requests are skipped so the regular synchronous
+    call can retry them and report the error. Does nothing if aiohttp is not
+    installed.
+
+    Args:
+        requests: (function_name, params) pairs, as passed to _make_api_request
+    """
+    if not AIOHTTP_AVAILABLE:
+        return
+
+    cache = get_data_cache()
+    pending = [
+        (function_name, params)
+        for function_name, params in requests
+        if cache.get("alpha_vantage", [function_name, params]) is None
+    ]
+    if not pending:
+        return
+
+    future = asyncio.run_coroutine_threadsafe(_fetch_all(pending), _get_loop())
+    for (function_name, params), result in zip(pending, future.result()):
+        if isinstance(result, Exception):
+            continue
+        try:
+            if _is_data_response(result):
+                cache.set("alpha_vantage", [function_name, params], result)
+        except AlphaVantageRateLimitError:
+            continue
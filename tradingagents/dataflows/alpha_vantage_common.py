@@ -1,10 +1,12 @@
 import os
 import requests
 import pandas as pd
-import json
 from datetime import datetime
 from io import StringIO
 
+from . import fastjson
+from .cache import get_data_cache
+
 API_BASE_URL = "https://www.alphavantage.co/query"
 
 def get_api_key() -> str:
@@ -39,12 +41,8 @@ class AlphaVantageRateLimitError(Exception):
     """Exception raised when Alpha Vantage API rate limit is exceeded."""
     pass
 
-def _make_api_request(function_name: str, params: dict) -> dict | str:
-    """Helper function to make API requests and handle responses.
-    
-    Raises:
-        AlphaVantageRateLimitError: When API rate limit is exceeded
-    """
+def _build_api_params(function_name: str, params: dict) -> dict:
+    """Build the full query parameters for an Alpha Vantage request."""
     # Create a copy of params to avoid modifying the original
     api_params = params.copy()
     api_params.update({
@@ -62,23 +60,55 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
     elif "entitlement" in api_params:
         # Remove entitlement if it's None or empty
         api_params.pop("entitlement", None)
+
+    return api_params
+
+def _is_data_response(response_text: str) -> bool:
+    """Check a response for errors and return whether it holds data worth caching.
+    
+    Raises:
+        AlphaVantageRateLimitError: When API rate limit is exceeded
+    """
+    # Check if response is JSON (error responses are typically JSON)
+    try:
+        response_json = fastjson.loads(response_text)
+    except ValueError:
+        # Response is not JSON (likely CSV data), which is normal
+        return True
+
+    # Check for rate limit error
+    if "Information" in response_json:
+        info_message = response_json["Information"]
+        if "rate limit" in info_message.lower() or "api key" in info_message.lower():
+            raise AlphaVantageRateLimitError(f"Alpha Vantage rate limit exceeded: {info_message}")
+        return False
+
+    return "Error Message" not in response_json and "Note" not in response_json
+
+def _make_api_request(function_name: str, params: dict) -> dict | str:
+    """Helper function to make API requests and handle responses.
+    
+    Responses are cached, so endpoints fetched ahead of time by
+    alpha_vantage_async.prefetch are served without a network call.
+    
+    Raises:
+        AlphaVantageRateLimitError: When API rate limit is exceeded
+    """
+    cache = get_data_cache()
+    cache_key = [function_name, params]
+    cached_response = cache.get("alpha_vantage", cache_key)
+    if cached_response is not None:
+        return cached_response
+
+    api_params = _build_api_params(function_name, params)
     
     response = requests.get(API_BASE_URL, params=api_params)
     response.raise_for_status()
 
     response_text = response.text
     
-    # Check if response is JSON (error responses are typically JSON)
-    try:
-        response_json = json.loads(response_text)
-        # Check for rate limit error
-        if "Information" in response_json:
-            info_message = response_json["Information"]
-            if "rate limit" in info_message.lower() or "api key" in info_message.lower():
-                raise AlphaVantageRateLimitError(f"Alpha Vantage rate limit exceeded: {info_message}")
-    except json.JSONDecodeError:
-        # Response is not JSON (likely CSV data), which is normal
-        pass
+    if _is_data_response(response_text):
+        cache.set("alpha_vantage", cache_key, response_text)
 
     return response_text
 
@@ -1,4 +1,9 @@
 from .alpha_vantage_common import _make_api_request
+from .alpha_vantage_async import prefetch
+from .config import get_config
+
+# Endpoints the fundamentals analyst reads for every ticker
+FUNDAMENTALS_FUNCTIONS = ("OVERVIEW", "BALANCE_SHEET", "CASH_FLOW", "INCOME_STATEMENT")
 
 
 def get_fundamentals(ticker: str, curr_date: str = None) -> str:
@@ -16,6 +21,10 @@ def get_fundamentals(ticker: str, curr_date: str = None) -> str:
         "symbol": ticker,
     }
 
+    # Opt-in: the statements are usually requested next, so fetch them concurrently now
+    if get_config().get("alpha_vantage_prefetch", False):
+        prefetch([(function_name, params) for function_name in FUNDAMENTALS_FUNCTIONS])
+
     return _make_api_request("OVERVIEW", params)
 
 
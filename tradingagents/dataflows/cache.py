@@ -0,0 +1,112 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from . import fastjson
+from .config import get_config
+
+
+class FileCache:
+    """JSON file cache for vendor responses with a time-to-live.
+
+    Entries are stored as ``<cache_dir>/<namespace>/<md5(key)>.json`` together
+    with the time they were written. The ``memory_size`` most recently used
+    entries are mirrored in memory so repeated lookups within the same process
+    do not touch the disk.
+    """
+
+    def __init__(self, cache_dir: str, ttl: float = 24 * 60 * 60, memory_size: int = 128):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.memory_size = memory_size
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, namespace: str, digest: str) -> str:
+        return os.path.join(self.cache_dir, namespace, f"{digest}.json")
+
+    def _remember(self, memory_key: tuple, entry: dict):
+        """Mirror an entry in memory, evicting the least recently used. Call with the lock held."""
+        self._memory[memory_key] = entry
+        self._memory.move_to_end(memory_key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    @staticmethod
+    def _digest(key: Any) -> str:
+        return hashlib.md5(fastjson.dumps(key)).hexdigest()
+
+    def get(self, namespace: str, key: Any) -> Optional[Any]:
+        """Return the cached value for key, or None if it is missing or expired."""
+        digest = self._digest(key)
+        memory_key = (namespace, digest)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(memory_key)
+        if entry is None:
+            try:
+                with open(self._path(namespace, digest), "rb") as f:
+                    entry = fastjson.loads(f.read())
+            except (OSError, ValueError):
+                return None
+
+        if now - entry["ts"] > self.ttl:
+            with self._lock:
+                self._memory.pop(memory_key, None)
+            return None
+
+        with self._lock:
+            self._remember(memory_key, entry)
+        return entry["value"]
+
+    def set(self, namespace: str, key: Any, value: Any):
+        """Store a JSON-serializable value for key."""
+        digest = self._digest(key)
+        entry = {"ts": time.time(), "value": value}
+
+        with self._lock:
+            self._remember((namespace, digest), entry)
+
+        path = self._path(namespace, digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(fastjson.dumps(entry))
+
+    def clear(self):
+        """Drop every cached entry, in memory and on disk."""
+        with self._lock:
+            self._memory.clear()
+            if not os.path.isdir(self.cache_dir):
+                return
+            for namespace in os.listdir(self.cache_dir):
+                namespace_dir = os.path.join(self.cache_dir, namespace)
+                if not os.path.isdir(namespace_dir):
+                    continue
+                for name in os.listdir(namespace_dir):
+                    if name.endswith(".json"):
+                        os.remove(os.path.join(namespace_dir, name))
+
+
+_cache: Optional[FileCache] = None
+
+
+def get_data_cache() -> FileCache:
+    """Get the vendor response cache for the current configuration."""
+    global _cache
+    config = get_config()
+    cache_dir = os.path.join(config["data_cache_dir"], "api_cache")
+    ttl = config.get("data_cache_ttl", 24 * 60 * 60)
+
+    if _cache is None or _cache.cache_dir != cache_dir:
+        _cache = FileCache(cache_dir, ttl)
+    _cache.ttl = ttl
+    return _cache
+
+
+def clear_data_cache():
+    """Clear all cached vendor responses."""
+    get_data_cache().clear()
@@ -0,0 +1,32 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes with sorted keys.
+
+    Uses orjson when it is installed. Values that are not JSON types are
+    serialized with str(), matching across both implementations.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(
+        obj, default=str, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize JSON from bytes or str. Raises ValueError on invalid input."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -24,10 +24,11 @@ from .alpha_vantage import (
     get_insider_transactions as get_alpha_vantage_insider_transactions,
     get_news as get_alpha_vantage_news
 )
-from .alpha_vantage_common import AlphaVantageRateLimitError
+from .alpha_vantage_common import AlphaVantageRateLimitError, _is_data_response
 
 # Configuration and routing logic
 from .config import get_config
+from .cache import get_data_cache
 
 # Tools organized by category
 TOOLS_CATEGORIES = {
@@ -147,6 +148,22 @@ def get_vendor(category: str, method: str = None) -> str:
     # Fall back to category-level configuration
     return config.get("data_vendors", {}).get(category, "default")
 
+def _is_cacheable(result) -> bool:
+    """Return whether a vendor result is real data rather than an error or notice.
+
+    Vendors report some failures as text ("Error ...", "No ... data found")
+    and Alpha Vantage as JSON "Information"/"Note"/"Error Message" payloads;
+    none of these may be served from the cache.
+    """
+    if not isinstance(result, str) or not result.strip():
+        return False
+    if result.startswith(("Error", "No ")):
+        return False
+    try:
+        return _is_data_response(result)
+    except AlphaVantageRateLimitError:
+        return False
+
 def route_to_vendor(method: str, *args, **kwargs):
     """Route method calls to appropriate vendor implementation with fallback support."""
     category = get_category_for_method(method)
@@ -158,6 +175,14 @@ def route_to_vendor(method: str, *args, **kwargs):
     if method not in VENDOR_METHODS:
         raise ValueError(f"Method '{method}' not supported")
 
+    # Serve repeated requests for the same data from the cache
+    cache = get_data_cache()
+    cache_key = [vendor_config, args, kwargs]
+    cached_result = cache.get(method, cache_key)
+    if cached_result is not None:
+        print(f"DEBUG: {method} - served from cache")
+        return cached_result
+
     # Get all available vendors for this method for fallback
     all_available_vendors = list(VENDOR_METHODS[method].keys())
     
@@ -247,7 +272,12 @@ def route_to_vendor(method: str, *args, **kwargs):
 
     # Return single result if only one, otherwise concatenate as string
     if len(results) == 1:
-        return results[0]
+        result = results[0]
     else:
         # Convert all results to strings and concatenate
-        return '\n'.join(str(result) for result in results)
\ No newline at end of file
+        result = '\n'.join(str(result) for result in results)
+
+    if all(_is_cacheable(r) for r in results):
+        cache.set(method, cache_key, result)
+
+    return result
\ No newline at end of file
@@ -299,28 +299,24 @@ def get_balance_sheet(
     curr_date: Annotated[str, "current date (not used for yfinance)"] = None
 ):
     """Get balance sheet data from yfinance."""
-    try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
-        if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_balance_sheet
-        else:
-            data = ticker_obj.balance_sheet
-            
-        if data.empty:
-            return f"No balance sheet data found for symbol '{ticker}'"
-            
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-        
-        # Add header information
-        header = f"# Balance Sheet data for {ticker.upper()} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    ticker_obj = yf.Ticker(ticker.upper())
+    
+    if freq.lower() == "quarterly":
+        data = ticker_obj.quarterly_balance_sheet
+    else:
+        data = ticker_obj.balance_sheet
         
-        return header + csv_string
+    if data.empty:
+        return f"No balance sheet data found for symbol '{ticker}'"
         
-    except Exception as e:
-        return f"Error retrieving balance sheet for {ticker}: {str(e)}"
+    # Convert to CSV string for consistency with other functions
+    csv_string = data.to_csv()
+    
+    # Add header information
+    header = f"# Balance Sheet data for {ticker.upper()} ({freq})\n"
+    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    
+    return header + csv_string
 
 
 def get_cashflow(
@@ -329,28 +325,24 @@ def get_cashflow(
     curr_date: Annotated[str, "current date (not used for yfinance)"] = None
 ):
     """Get cash flow data from yfinance."""
-    try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
-        if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_cashflow
-        else:
-            data = ticker_obj.cashflow
-            
-        if data.empty:
-            return f"No cash flow data found for symbol '{ticker}'"
-            
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-        
-        # Add header information
-        header = f"# Cash Flow data for {ticker.upper()} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    ticker_obj = yf.Ticker(ticker.upper())
+    
+    if freq.lower() == "quarterly":
+        data = ticker_obj.quarterly_cashflow
+    else:
+        data = ticker_obj.cashflow
         
-        return header + csv_string
+    if data.empty:
+        return f"No cash flow data found for symbol '{ticker}'"
         
-    except Exception as e:
-        return f"Error retrieving cash flow for {ticker}: {str(e)}"
+    # Convert to CSV string for consistency with other functions
+    csv_string = data.to_csv()
+    
+    # Add header information
+    header = f"# Cash Flow data for {ticker.upper()} ({freq})\n"
+    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    
+    return header + csv_string
 
 
 def get_income_statement(
@@ -359,49 +351,41 @@ def get_income_statement(
     curr_date: Annotated[str, "current date (not used for yfinance)"] = None
 ):
     """Get income statement data from yfinance."""
-    try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        
-        if freq.lower() == "quarterly":
-            data = ticker_obj.quarterly_income_stmt
-        else:
-            data = ticker_obj.income_stmt
-            
-        if data.empty:
-            return f"No income statement data found for symbol '{ticker}'"
-            
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-        
-        # Add header information
-        header = f"# Income Statement data for {ticker.upper()} ({freq})\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    ticker_obj = yf.Ticker(ticker.upper())
+    
+    if freq.lower() == "quarterly":
+        data = ticker_obj.quarterly_income_stmt
+    else:
+        data = ticker_obj.income_stmt
         
-        return header + csv_string
+    if data.empty:
+        return f"No income statement data found for symbol '{ticker}'"
         
-    except Exception as e:
-        return f"Error retrieving income statement for {ticker}: {str(e)}"
+    # Convert to CSV string for consistency with other functions
+    csv_string = data.to_csv()
+    
+    # Add header information
+    header = f"# Income Statement data for {ticker.upper()} ({freq})\n"
+    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    
+    return header + csv_string
 
 
 def get_insider_transactions(
     ticker: Annotated[str, "ticker symbol of the company"]
 ):
     """Get insider transactions data from yfinance."""
-    try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        data = ticker_obj.insider_transactions
-        
-        if data is None or data.empty:
-            return f"No insider transactions data found for symbol '{ticker}'"
-            
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
-        
-        # Add header information
-        header = f"# Insider Transactions data for {ticker.upper()}\n"
-        header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        
-        return header + csv_string
+    ticker_obj = yf.Ticker(ticker.upper())
+    data = ticker_obj.insider_transactions
+    
+    if data is None or data.empty:
+        return f"No insider transactions data found for symbol '{ticker}'"
         
-    except Exception as e:
-        return f"Error retrieving insider transactions for {ticker}: {str(e)}"
\ No newline at end of file
+    # Convert to CSV string for consistency with other functions
+    csv_string = data.to_csv()
+    
+    # Add header information
+    header = f"# Insider Transactions data for {ticker.upper()}\n"
+    header += f"# Data retrieved on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    
+    return header + csv_string
@@ -8,15 +8,30 @@ DEFAULT_CONFIG = {
         os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
         "dataflows/data_cache",
     ),
+    # Seconds a cached vendor response stays valid
+    "data_cache_ttl": 24 * 60 * 60,
+    # Fetch the Alpha Vantage statements together with the company overview.
+    # Each call spends three extra requests of the per-minute/per-day quota
+    "alpha_vantage_prefetch": False,
     # LLM settings
     "llm_provider": "openai",
     "deep_think_llm": "o4-mini",
     "quick_think_llm": "gpt-4o-mini",
     "backend_url": "https://api.openai.com/v1",
+    # Per-role OpenAI prompt_cache_key prefix, e.g. "trading-agents-v1" (None disables)
+    "prompt_cache_key": None,
+    # Share one pooled HTTP/2 client across OpenAI-compatible LLM calls
+    "llm_http2": False,
+    # Stream tokens from OpenAI-compatible LLMs so callbacks see them as they arrive
+    "llm_streaming": False,
     # Debate and discussion settings
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Async runs: analysts running at once, retries per analyst and base backoff in seconds
+    "max_concurrent_analysts": 4,
+    "max_retries": 2,
+    "retry_backoff": 2.0,
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
@@ -1,6 +1,6 @@
 # TradingAgents/graph/setup.py
 
-from typing import Dict, Any
+from typing import Dict, Any, Callable, NamedTuple
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph, START
 from langgraph.prebuilt import ToolNode
@@ -11,6 +11,33 @@ from tradingagents.agents.utils.agent_states import AgentState
 from .conditional_logic import ConditionalLogic
 
 
+class AnalystSpec(NamedTuple):
+    """Static description of an analyst that can be selected for a run."""
+
+    name: str
+    node: Callable
+    report_key: str
+
+
+# Every selectable analyst, keyed by the name used in selected_analysts
+ANALYST_REGISTRY: Dict[str, AnalystSpec] = {
+    "market": AnalystSpec("market", create_market_analyst, "market_report"),
+    "social": AnalystSpec("social", create_social_media_analyst, "sentiment_report"),
+    "news": AnalystSpec("news", create_news_analyst, "news_report"),
+    "fundamentals": AnalystSpec(
+        "fundamentals", create_fundamentals_analyst, "fundamentals_report"
+    ),
+}
+
+
+def get_analyst_specs(selected_analysts):
+    """Resolve analyst names to their specs, preserving the selection order."""
+    try:
+        return tuple(ANALYST_REGISTRY[name] for name in selected_analysts)
+    except KeyError as e:
+        raise ValueError(f"Unknown analyst type: {e.args[0]}") from None
+
+
 class GraphSetup:
     """Handles the setup and configuration of the agent graph."""
 
@@ -25,8 +52,14 @@ class GraphSetup:
         invest_judge_memory,
         risk_manager_memory,
         conditional_logic: ConditionalLogic,
+        prompt_cache_key: str = None,
     ):
-        """Initialize with required components."""
+        """Initialize with required components.
+
+        If prompt_cache_key is set, every agent role sends its own
+        "<prompt_cache_key>-<role>" key so OpenAI routes requests that share a
+        system prompt to the same prompt cache.
+        """
         self.quick_thinking_llm = quick_thinking_llm
         self.deep_thinking_llm = deep_thinking_llm
         self.tool_nodes = tool_nodes
@@ -36,6 +69,15 @@ class GraphSetup:
         self.invest_judge_memory = invest_judge_memory
         self.risk_manager_memory = risk_manager_memory
         self.conditional_logic = conditional_logic
+        self.prompt_cache_key = prompt_cache_key
+
+    def _role_llm(self, llm, role):
+        """Return a copy of llm tagged with the prompt cache key for an agent role."""
+        if not self.prompt_cache_key:
+            return llm
+        extra_body = dict(llm.extra_body or {})
+        extra_body["prompt_cache_key"] = f"{self.prompt_cache_key}-{role}"
+        return llm.model_copy(update={"extra_body": extra_body})
 
     def setup_graph(
         self, selected_analysts=["market", "social", "news", "fundamentals"]
@@ -52,79 +94,21 @@ class GraphSetup:
         if len(selected_analysts) == 0:
             raise ValueError("Trading Agents Graph Setup Error: no analysts selected!")
 
-        # Create analyst nodes
-        analyst_nodes = {}
-        delete_nodes = {}
-        tool_nodes = {}
-
-        if "market" in selected_analysts:
-            analyst_nodes["market"] = create_market_analyst(
-                self.quick_thinking_llm
-            )
-            delete_nodes["market"] = create_msg_delete()
-            tool_nodes["market"] = self.tool_nodes["market"]
-
-        if "social" in selected_analysts:
-            analyst_nodes["social"] = create_social_media_analyst(
-                self.quick_thinking_llm
-            )
-            delete_nodes["social"] = create_msg_delete()
-            tool_nodes["social"] = self.tool_nodes["social"]
-
-        if "news" in selected_analysts:
-            analyst_nodes["news"] = create_news_analyst(
-                self.quick_thinking_llm
-            )
-            delete_nodes["news"] = create_msg_delete()
-            tool_nodes["news"] = self.tool_nodes["news"]
-
-        if "fundamentals" in selected_analysts:
-            analyst_nodes["fundamentals"] = create_fundamentals_analyst(
-                self.quick_thinking_llm
-            )
-            delete_nodes["fundamentals"] = create_msg_delete()
-            tool_nodes["fundamentals"] = self.tool_nodes["fundamentals"]
-
-        # Create researcher and manager nodes
-        bull_researcher_node = create_bull_researcher(
-            self.quick_thinking_llm, self.bull_memory
-        )
-        bear_researcher_node = create_bear_researcher(
-            self.quick_thinking_llm, self.bear_memory
-        )
-        research_manager_node = create_research_manager(
-            self.deep_thinking_llm, self.invest_judge_memory
-        )
-        trader_node = create_trader(self.quick_thinking_llm, self.trader_memory)
-
-        # Create risk analysis nodes
-        risky_analyst = create_risky_debator(self.quick_thinking_llm)
-        neutral_analyst = create_neutral_debator(self.quick_thinking_llm)
-        safe_analyst = create_safe_debator(self.quick_thinking_llm)
-        risk_manager_node = create_risk_manager(
-            self.deep_thinking_llm, self.risk_manager_memory
-        )
+        specs = get_analyst_specs(selected_analysts)
 
         # Create workflow
         workflow = StateGraph(AgentState)
 
         # Add analyst nodes to the graph
-        for analyst_type, node in analyst_nodes.items():
-            workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
+        for spec in specs:
             workflow.add_node(
-                f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
+                f"{spec.name.capitalize()} Analyst",
+                spec.node(self._role_llm(self.quick_thinking_llm, spec.name)),
             )
-            workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
-
-        # Add other nodes
-        workflow.add_node("Bull Researcher", bull_researcher_node)
-        workflow.add_node("Bear Researcher", bear_researcher_node)
-        workflow.add_node("Research Manager", research_manager_node)
-        workflow.add_node("Trader", trader_node)
-        workflow.add_node("Risky Analyst", risky_analyst)
-        workflow.add_node("Neutral Analyst", neutral_analyst)
-        workflow.add_node("Safe Analyst", safe_analyst)
-        workflow.add_node("Risk Judge", risk_manager_node)
+            workflow.add_node(
+                f"Msg Clear {spec.name.capitalize()}", create_msg_delete()
+            )
+            workflow.add_node(f"tools_{spec.name}", self.tool_nodes[spec.name])
 
         # Define edges
         # Start with the first analyst
@@ -152,7 +136,102 @@ class GraphSetup:
             else:
                 workflow.add_edge(current_clear, "Bull Researcher")
 
-        # Add remaining edges
+        # Add research, trading and risk nodes and edges
+        self._add_decision_nodes(workflow)
+
+        # Compile and return
+        return workflow.compile()
+
+    def setup_analyst_graph(self, analyst_type):
+        """Set up and compile a standalone graph for a single analyst.
+
+        The analyst and its tool loop run on their own message history, so
+        several of these graphs can be executed concurrently.
+
+        Args:
+            analyst_type (str): One of "market", "social", "news" or "fundamentals"
+        """
+        (spec,) = get_analyst_specs([analyst_type])
+
+        current_analyst = f"{analyst_type.capitalize()} Analyst"
+        current_tools = f"tools_{analyst_type}"
+        current_clear = f"Msg Clear {analyst_type.capitalize()}"
+
+        workflow = StateGraph(AgentState)
+        workflow.add_node(
+            current_analyst,
+            spec.node(
+                self._role_llm(self.quick_thinking_llm, analyst_type)
+            ),
+        )
+        workflow.add_node(current_clear, create_msg_delete())
+        workflow.add_node(current_tools, self.tool_nodes[analyst_type])
+
+        workflow.add_edge(START, current_analyst)
+        workflow.add_conditional_edges(
+            current_analyst,
+            getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+            [current_tools, current_clear],
+        )
+        workflow.add_edge(current_tools, current_analyst)
+        workflow.add_edge(current_clear, END)
+
+        return workflow.compile()
+
+    def setup_decision_graph(self):
+        """Set up and compile the research, trading and risk part of the workflow.
+
+        The input state is expected to already contain the analyst reports.
+        """
+        workflow = StateGraph(AgentState)
+        self._add_decision_nodes(workflow)
+        workflow.add_edge(START, "Bull Researcher")
+
+        return workflow.compile()
+
+    def _add_decision_nodes(self, workflow):
+        """Add the researcher, trader and risk nodes and their edges to a workflow."""
+        # Create researcher and manager nodes
+        bull_researcher_node = create_bull_researcher(
+            self._role_llm(self.quick_thinking_llm, "bull"), self.bull_memory
+        )
+        bear_researcher_node = create_bear_researcher(
+            self._role_llm(self.quick_thinking_llm, "bear"), self.bear_memory
+        )
+        research_manager_node = create_research_manager(
+            self._role_llm(self.deep_thinking_llm, "research_manager"),
+            self.invest_judge_memory,
+        )
+        trader_node = create_trader(
+            self._role_llm(self.quick_thinking_llm, "trader"), self.trader_memory
+        )
+
+        # Create risk analysis nodes
+        risky_analyst = create_risky_debator(
+            self._role_llm(self.quick_thinking_llm, "risky")
+        )
+        neutral_analyst = create_neutral_debator(
+            self._role_llm(self.quick_thinking_llm, "neutral")
+        )
+        safe_analyst = create_safe_debator(
+            self._role_llm(self.quick_thinking_llm, "safe")
+        )
+        risk_manager_node = create_risk_manager(
+            self._role_llm(self.deep_thinking_llm, "risk_manager"),
+            self.risk_manager_memory,
+        )
+
+        # Add nodes
+        workflow.add_node("Bull Researcher", bull_researcher_node)
+        workflow.add_node("Bear Researcher", bear_researcher_node)
+        workflow.add_node("Research Manager", research_manager_node)
+        workflow.add_node("Trader", trader_node)
+        workflow.add_node("Risky Analyst", risky_analyst)
+        workflow.add_node("Neutral Analyst", neutral_analyst)
+        workflow.add_node("Safe Analyst", safe_analyst)
+        workflow.add_node("Risk Judge", risk_manager_node)
+
+        # Add edges
         workflow.add_conditional_edges(
             "Bull Researcher",
             self.conditional_logic.should_continue_debate,
@@ -197,6 +276,3 @@ class GraphSetup:
         )
 
         workflow.add_edge("Risk Judge", END)
-
-        # Compile and return
-        return workflow.compile()
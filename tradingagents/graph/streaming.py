@@ -0,0 +1,74 @@
+# TradingAgents/graph/streaming.py
+
+import asyncio
+from typing import Any, Dict, Optional, Protocol
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+
+class EventQueue(Protocol):
+    """Anything events can be put on without blocking, e.g. asyncio.Queue or queue.Queue."""
+
+    def put_nowait(self, item: Dict[str, str]) -> None: ...
+
+
+class AgentEventHandler(BaseCallbackHandler):
+    """Forward agent activity from a running graph to a queue.
+
+    Each event is a dict of the form
+    ``{"event_type": "thought" | "action" | "result", "agent": str, "content": str}``
+    where ``agent`` is the LangGraph node that produced it. "thought" events
+    carry single LLM tokens (the LLM must be created with streaming enabled),
+    "action" events describe tool calls and "result" events the full text of
+    a finished LLM call.
+    """
+
+    def __init__(self, queue: EventQueue, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Create a handler that puts events on queue from any thread.
+
+        queue is usually an asyncio.Queue read by a coroutine, or a
+        thread-safe queue.Queue read from another thread. Graph nodes run in
+        worker threads, so events are handed over to the event loop, which
+        defaults to the running loop; put_nowait is called on that loop.
+        """
+        self.queue = queue
+        self.loop = loop or asyncio.get_running_loop()
+        self._agents: Dict[UUID, str] = {}
+
+    def _emit(self, event_type: str, agent: str, content: str):
+        if self.loop.is_closed():
+            return
+        event = {"event_type": event_type, "agent": agent, "content": content}
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, event)
+
+    @staticmethod
+    def _node(metadata: Optional[Dict[str, Any]]) -> str:
+        return (metadata or {}).get("langgraph_node", "")
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, metadata=None, **kwargs):
+        self._agents[run_id] = self._node(metadata)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, metadata=None, **kwargs):
+        self._agents[run_id] = self._node(metadata)
+
+    def on_llm_new_token(self, token, *, run_id, **kwargs):
+        if token:
+            self._emit("thought", self._agents.get(run_id, ""), token)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        agent = self._agents.pop(run_id, "")
+        text = "".join(
+            generation.text
+            for generations in response.generations
+            for generation in generations
+        )
+        if text:
+            self._emit("result", agent, text)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._agents.pop(run_id, None)
+
+    def on_tool_start(self, serialized, input_str, *, run_id, metadata=None, **kwargs):
+        name = (serialized or {}).get("name") or kwargs.get("name", "tool")
+        self._emit("action", self._node(metadata), f"{name}({input_str})")
@@ -1,11 +1,18 @@
 # TradingAgents/graph/trading_graph.py
 
 import os
+import asyncio
+import logging
+import threading
 from pathlib import Path
 import json
 from datetime import date
 from typing import Dict, Any, Tuple, List, Optional
 
+import anthropic
+import httpx
+import openai
+
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -37,11 +44,60 @@ from tradingagents.agents.utils.agent_utils import (
 )
 
 from .conditional_logic import ConditionalLogic
-from .setup import GraphSetup
+from .setup import GraphSetup, get_analyst_specs
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
 
+logger = logging.getLogger(__name__)
+
+# Errors worth retrying an analyst for: rate limits, timeouts, dropped
+# connections and provider 5xx. Auth, bad-request and code errors fail at once.
+_TRANSIENT_ERRORS: Tuple[type, ...] = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    anthropic.RateLimitError,
+    anthropic.APIConnectionError,
+    anthropic.InternalServerError,
+    httpx.TransportError,
+    asyncio.TimeoutError,
+    TimeoutError,
+    ConnectionError,
+)
+try:
+    from google.api_core import exceptions as google_exceptions
+
+    _TRANSIENT_ERRORS += (
+        google_exceptions.ResourceExhausted,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.DeadlineExceeded,
+    )
+except ImportError:
+    pass
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def get_shared_http_client() -> httpx.Client:
+    """Return the process-wide HTTP/2 client shared by OpenAI-compatible LLMs.
+
+    Every agent turn reuses the same pooled connections, and concurrent turns
+    are multiplexed as HTTP/2 streams instead of each paying for a new
+    TCP/TLS handshake. Falls back to HTTP/1.1 keep-alive if h2 is not installed.
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            try:
+                _http_client = httpx.Client(http2=True, limits=limits)
+            except ImportError:
+                print("Warning: h2 not installed, using HTTP/1.1 for LLM requests")
+                _http_client = httpx.Client(limits=limits)
+    return _http_client
+
 
 class TradingAgentsGraph:
     """Main class that orchestrates the trading agents framework."""
@@ -73,8 +129,10 @@ class TradingAgentsGraph:
 
         # Initialize LLMs
         if self.config["llm_provider"].lower() == "openai" or self.config["llm_provider"] == "ollama" or self.config["llm_provider"] == "openrouter":
-            self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
+            http_client = get_shared_http_client() if self.config.get("llm_http2") else None
+            streaming = self.config.get("llm_streaming", False)
+            self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"], http_client=http_client, streaming=streaming)
+            self.quick_thinking_llm = ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"], http_client=http_client, streaming=streaming)
         elif self.config["llm_provider"].lower() == "anthropic":
             self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
             self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
@@ -106,6 +164,11 @@ class TradingAgentsGraph:
             self.invest_judge_memory,
             self.risk_manager_memory,
             self.conditional_logic,
+            prompt_cache_key=(
+                self.config.get("prompt_cache_key")
+                if self.config["llm_provider"].lower() == "openai"
+                else None
+            ),
         )
 
         self.propagator = Propagator()
@@ -115,11 +178,16 @@ class TradingAgentsGraph:
         # State tracking
         self.curr_state = None
         self.ticker = None
-        self.log_states_dict = {}  # date to full state dict
 
         # Set up the graph
+        self.selected_analysts = list(selected_analysts)
+        self.analyst_specs = get_analyst_specs(self.selected_analysts)
         self.graph = self.graph_setup.setup_graph(selected_analysts)
 
+        # Per-analyst and decision graphs used by the async path, compiled on first use
+        self._analyst_graphs = None
+        self._decision_graph = None
+
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
         """Create tool nodes for different data sources using abstract methods."""
         return {
@@ -192,9 +260,103 @@ class TradingAgentsGraph:
         # Return decision and processed signal
         return final_state, self.process_signal(final_state["final_trade_decision"])
 
+    async def astream_propagate(self, company_name, trade_date, callbacks=None):
+        """Run the trading agents graph asynchronously, yielding the state as it fills in.
+
+        The analysts are independent of each other until the research debate,
+        so each one runs on its own graph and all of them are awaited together.
+        The merged state is yielded as every analyst finishes and then after
+        each node of the research, trading and risk graph. Rate limits,
+        timeouts and connection errors are retried up to config["max_retries"]
+        times; any other error fails the analyst at once. A failed analyst
+        leaves its report empty and is listed with its error under
+        "analyst_errors" in every yielded state; if no analyst succeeds a
+        RuntimeError is raised before the debate starts.
+
+        callbacks are attached to every node, e.g. an AgentEventHandler to
+        receive LLM tokens and tool calls while the agents are running.
+        """
+
+        self.ticker = company_name
+
+        # Initialize state
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
+        )
+        args = self.propagator.get_graph_args()
+        if callbacks:
+            args["config"] = {**args["config"], "callbacks": callbacks}
+
+        if self._analyst_graphs is None:
+            self._analyst_graphs = {
+                spec: self.graph_setup.setup_analyst_graph(spec.name)
+                for spec in self.analyst_specs
+            }
+            self._decision_graph = self.graph_setup.setup_decision_graph()
+
+        # Bound concurrent analysts and retry failures with exponential backoff
+        semaphore = asyncio.Semaphore(self.config.get("max_concurrent_analysts", 4))
+        max_retries = self.config.get("max_retries", 2)
+        retry_backoff = self.config.get("retry_backoff", 2.0)
+
+        async def run_analyst(spec, graph):
+            async with semaphore:
+                for attempt in range(max_retries + 1):
+                    try:
+                        return spec, await graph.ainvoke(init_agent_state, **args)
+                    except _TRANSIENT_ERRORS as e:
+                        if attempt == max_retries:
+                            return spec, e
+                        logger.info("Retrying %s analyst after: %s", spec.name, e)
+                        await asyncio.sleep(retry_backoff * 2**attempt)
+                    except Exception as e:
+                        return spec, e
+
+        # Fan out the analysts and merge their reports as they complete
+        state = dict(init_agent_state)
+        errors = {}
+        analyst_runs = [
+            asyncio.ensure_future(run_analyst(spec, graph))
+            for spec, graph in self._analyst_graphs.items()
+        ]
+        try:
+            for analyst_run in asyncio.as_completed(analyst_runs):
+                spec, result = await analyst_run
+                if isinstance(result, Exception):
+                    logger.warning("%s analyst failed for %s: %s", spec.name, company_name, result)
+                    errors[spec.name] = str(result)
+                else:
+                    state[spec.report_key] = result[spec.report_key]
+                yield {**state, "analyst_errors": dict(errors)}
+        finally:
+            # Stop the remaining analysts if the caller stops iterating early
+            for analyst_run in analyst_runs:
+                analyst_run.cancel()
+
+        if len(errors) == len(self._analyst_graphs):
+            raise RuntimeError(
+                f"All analysts failed for {company_name}: "
+                + "; ".join(f"{name}: {error}" for name, error in errors.items())
+            )
+
+        final_state = state
+        async for chunk in self._decision_graph.astream(state, **args):
+            final_state = {**chunk, "analyst_errors": errors}
+            yield final_state
+
+        # Store current state for reflection
+        self.curr_state = final_state
+
+        # Log state without blocking the event loop on the file write
+        await asyncio.to_thread(self._log_state, trade_date, final_state)
+
     def _log_state(self, trade_date, final_state):
-        """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        """Log the final state to a JSON file.
+
+        Only this run's state is written. The graph may be shared across
+        tickers and concurrent runs, so nothing is accumulated on the instance.
+        """
+        entry = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -224,15 +386,17 @@ class TradingAgentsGraph:
             "final_trade_decision": final_state["final_trade_decision"],
         }
 
-        # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
+        # Save to file. The ticker is taken from the state rather than
+        # self.ticker, which may already belong to a concurrent run.
+        ticker = final_state["company_of_interest"]
+        directory = Path(f"eval_results/{ticker}/TradingAgentsStrategy_logs/")
         directory.mkdir(parents=True, exist_ok=True)
 
         with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
+            f"eval_results/{ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
             "w",
         ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+            json.dump({str(trade_date): entry}, f, indent=4)
 
     def reflect_and_remember(self, returns_losses):
         """Reflect on decisions and update memory based on returns."""